@@ -8,7 +8,7 @@ Microsoft Word documents to Markdown+LaTeX.
 import os
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import click
 from rich.console import Console
@@ -16,8 +16,6 @@ from rich.panel import Panel
 
 from docx2md import __version__
 from docx2md.config import load_config
-from docx2md.converter import convert_docx_to_markdown, batch_convert
-from docx2md.processors.equations import fix_delimiters
 from docx2md.utils.logging_utils import setup_logger
 
 # Initialize console for rich output
@@ -25,6 +23,12 @@ console = Console()
 logger = setup_logger()
 
 
+def _enable_skip_unchanged(config_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of *config_data* with processing.skip_unchanged turned on."""
+    processing = {**config_data.get("processing", {}), "skip_unchanged": True}
+    return {**config_data, "processing": processing}
+
+
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
 @click.version_option(__version__, "-v", "--version", prog_name="docx2md")
 def main() -> None:
@@ -49,8 +53,19 @@ def main() -> None:
     default="info",
     help="Set the logging level",
 )
+@click.option(
+    "--skip-unchanged",
+    is_flag=True,
+    default=False,
+    help="Skip the conversion if the input and settings are unchanged since the "
+    "last run (keeps an <output>.cache file next to the output)",
+)
 def convert(
-    input_file: str, output_file: Optional[str], config: Optional[str], log_level: str
+    input_file: str,
+    output_file: Optional[str],
+    config: Optional[str],
+    log_level: str,
+    skip_unchanged: bool,
 ) -> None:
     """
     Convert a Word document to Markdown+LaTeX.
@@ -58,10 +73,14 @@ def convert(
     INPUT_FILE: Path to the Word document (.docx) to convert
     OUTPUT_FILE: Path for the output Markdown file (optional, defaults to same name with .md extension)
     """
+    from docx2md.converter import convert_docx_to_markdown
+    
     logger.setLevel(log_level.upper())
     
     # Load configuration if provided
     config_data = load_config(config) if config else {}
+    if skip_unchanged:
+        config_data = _enable_skip_unchanged(config_data)
     
     # Determine output file path if not provided
     if not output_file:
@@ -101,12 +120,20 @@ def convert(
     default=True,
     help="Process files in parallel",
 )
+@click.option(
+    "--skip-unchanged",
+    is_flag=True,
+    default=False,
+    help="Skip documents whose input and settings are unchanged since the "
+    "last run (keeps an <output>.cache file next to each output)",
+)
 def batch(
     input_dir: str,
     output_dir: Optional[str],
     config: Optional[str],
     recursive: bool,
     parallel: bool,
+    skip_unchanged: bool,
 ) -> None:
     """
     Convert multiple Word documents to Markdown+LaTeX.
@@ -114,8 +141,12 @@ def batch(
     INPUT_DIR: Directory containing Word documents (.docx) to convert
     OUTPUT_DIR: Directory for output Markdown files (optional, defaults to same as input)
     """
+    from docx2md.converter import batch_convert
+    
     # Load configuration if provided
     config_data = load_config(config) if config else {}
+    if skip_unchanged:
+        config_data = _enable_skip_unchanged(config_data)
     
     # Determine output directory if not provided
     if not output_dir:
@@ -170,6 +201,8 @@ def fix_delimiters_cmd(
     INPUT_FILE: Path to the Markdown file to process
     OUTPUT_FILE: Path for the output file (optional, defaults to overwriting input)
     """
+    from docx2md.processors.equations import fix_delimiters
+    
     # Parse delimiter options
     inline_start, inline_end = inline_delimiters.split(",")
     display_start, display_end = display_delimiters.split(",")
@@ -5,11 +5,12 @@ This module provides functions for loading and validating configuration
 from YAML files, environment variables, and command-line arguments.
 """
 
+import copy
+import functools
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
-
-import yaml
+from typing import Any, Dict, Optional, Tuple, Union
 
 from docx2md.utils.logging_utils import get_logger
 
@@ -47,6 +48,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "fix_equations": True,
         "generate_frontmatter": True,
         "structure_front_matter": True,
+        "skip_unchanged": False,  # reuse output when input and config are unchanged (<output>.cache)
     },
     "cleanup": {
         "strip_triple_dollar": True,
@@ -92,6 +94,13 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 }
 
 
+# Prefix for configuration environment variables
+_ENV_PREFIX = "DOCX2MD_"
+
+# (DOCX2MD_ items, parsed config) from the last _load_from_env call
+_ENV_CONFIG_CACHE: Optional[Tuple[Tuple[Tuple[str, str], ...], Dict[str, Any]]] = None
+
+
 def load_config(config_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
     """
     Load configuration from a YAML file and merge with defaults.
@@ -102,10 +111,17 @@ def load_config(config_path: Optional[Union[str, Path]] = None) -> Dict[str, Any
     Returns:
         Dict containing the merged configuration
     """
-    config = DEFAULT_CONFIG.copy()
-    
     # Check for environment variables
     env_config = _load_from_env()
+    
+    # Plain defaults: DEFAULT_CONFIG is valid as written, so there is
+    # nothing to validate — just hand out a private copy
+    if not config_path and not env_config:
+        return _copy_config(DEFAULT_CONFIG)
+    
+    # Copy so merging never mutates the nested dicts of DEFAULT_CONFIG
+    config = _copy_config(DEFAULT_CONFIG)
+    
     if env_config:
         _deep_merge(config, env_config)
     
@@ -121,10 +137,33 @@ def load_config(config_path: Optional[Union[str, Path]] = None) -> Dict[str, Any
     return config
 
 
+def _copy_config(value: Any) -> Any:
+    """
+    Copy a configuration tree of dicts and lists.
+    
+    Much cheaper than copy.deepcopy, which has to handle arbitrary objects
+    and shared references; config values are otherwise immutable scalars.
+    
+    Args:
+        value: Configuration value to copy
+        
+    Returns:
+        Copy sharing no dicts or lists with the original
+    """
+    if isinstance(value, dict):
+        return {key: _copy_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_config(item) for item in value]
+    return value
+
+
 def _load_from_file(config_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Load configuration from a YAML file.
     
+    The parsed file is cached per (path, mtime), so repeated loads of an
+    unchanged file (e.g. once per batch worker) skip the YAML parse.
+    
     Args:
         config_path: Path to the configuration file
         
@@ -132,19 +171,46 @@ def _load_from_file(config_path: Union[str, Path]) -> Dict[str, Any]:
         Dict containing the configuration from the file
     """
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        path = os.path.abspath(config_path)
+        config = _parse_config_file(path, os.stat(path).st_mtime)
         
         if not isinstance(config, dict):
             logger.warning(f"Configuration file {config_path} does not contain a dictionary")
             return {}
         
-        return config
+        # The cached object is shared — hand out a private copy
+        return copy.deepcopy(config)
     except Exception as e:
         logger.warning(f"Failed to load configuration from {config_path}: {str(e)}")
         return {}
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime: float) -> Any:
+    """
+    Parse a YAML configuration file.
+    
+    ``mtime`` is only part of the cache key: editing the file invalidates
+    the cached result.
+    
+    Args:
+        path: Absolute path to the configuration file
+        mtime: Modification time of the file
+        
+    Returns:
+        The parsed YAML document
+    """
+    # PyYAML is imported here rather than at module level: it accounts for
+    # about an eighth of the CLI's import time and most runs have no config file
+    import yaml
+    
+    # Prefer libyaml's C parser when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=loader)
+
+
 def _load_from_env() -> Dict[str, Any]:
     """
     Load configuration from environment variables.
@@ -152,14 +218,25 @@ def _load_from_env() -> Dict[str, Any]:
     Environment variables should be prefixed with DOCX2MD_ and use double underscores
     to indicate nesting, e.g., DOCX2MD_EQUATIONS__INLINE_DELIMITERS="$,$"
     
+    The parsed result is cached for as long as the set of DOCX2MD_ variables
+    is unchanged, so repeated calls only pay for the prefix scan.
+    
     Returns:
         Dict containing the configuration from environment variables
     """
-    config: Dict[str, Any] = {}
+    global _ENV_CONFIG_CACHE
     
-    for key, value in os.environ.items():
-        if key.startswith("DOCX2MD_"):
-            parts = key[8:].lower().split("__")
+    items = tuple(
+        (key, os.environ[key]) for key in os.environ if key.startswith(_ENV_PREFIX)
+    )
+    if not items:
+        return {}
+    
+    if _ENV_CONFIG_CACHE is None or _ENV_CONFIG_CACHE[0] != items:
+        config: Dict[str, Any] = {}
+        
+        for key, value in items:
+            parts = key[len(_ENV_PREFIX):].lower().split("__")
             
             # Build nested dictionary
             current = config
@@ -170,8 +247,17 @@ def _load_from_env() -> Dict[str, Any]:
             
             # Set the value
             current[parts[-1]] = _parse_env_value(value)
+        
+        _ENV_CONFIG_CACHE = (items, config)
     
-    return config
+    # The cached dict is shared — hand out a private copy
+    return copy.deepcopy(_ENV_CONFIG_CACHE[1])
+
+
+_TRUE_VALUES = frozenset({"true", "yes", "1"})
+_FALSE_VALUES = frozenset({"false", "no", "0"})
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
 
 
 def _parse_env_value(value: str) -> Any:
@@ -185,22 +271,19 @@ def _parse_env_value(value: str) -> Any:
         Parsed value (bool, int, float, list, or string)
     """
     # Check for boolean
-    if value.lower() in ("true", "yes", "1"):
+    lowered = value.lower()
+    if lowered in _TRUE_VALUES:
         return True
-    if value.lower() in ("false", "no", "0"):
+    if lowered in _FALSE_VALUES:
         return False
     
-    # Check for integer
-    try:
-        return int(value)
-    except ValueError:
-        pass
-    
-    # Check for float
-    try:
-        return float(value)
-    except ValueError:
-        pass
+    # Check for integer / float (classified up front, so plain strings
+    # never go through a failing int()/float() conversion)
+    stripped = value.strip()
+    if _INT_RE.fullmatch(stripped):
+        return int(stripped)
+    if _FLOAT_RE.fullmatch(stripped):
+        return float(stripped)
     
     # Check for list (comma-separated)
     if "," in value:
@@ -218,11 +301,16 @@ def _deep_merge(target: Dict[str, Any], source: Dict[str, Any]) -> None:
         target: Target dictionary to merge into
         source: Source dictionary to merge from
     """
-    for key, value in source.items():
-        if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-            _deep_merge(target[key], value)
-        else:
-            target[key] = value
+    # Walk nested sections with an explicit stack instead of recursing
+    stack = [(target, source)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                dst[key] = value
 
 
 def _validate_config(config: Dict[str, Any]) -> None:
@@ -235,14 +323,14 @@ def _validate_config(config: Dict[str, Any]) -> None:
     # Ensure required sections exist
     for section in DEFAULT_CONFIG:
         if section not in config:
-            config[section] = DEFAULT_CONFIG[section].copy()
+            config[section] = copy.deepcopy(DEFAULT_CONFIG[section])
     
     # Validate equation delimiters
     eq_config = config.get("equations", {})
     if not isinstance(eq_config.get("inline_delimiters"), list) or len(eq_config.get("inline_delimiters", [])) != 2:
         logger.warning("Invalid inline_delimiters configuration, using defaults")
-        eq_config["inline_delimiters"] = DEFAULT_CONFIG["equations"]["inline_delimiters"]
+        eq_config["inline_delimiters"] = list(DEFAULT_CONFIG["equations"]["inline_delimiters"])
     
     if not isinstance(eq_config.get("display_delimiters"), list) or len(eq_config.get("display_delimiters", [])) != 2:
         logger.warning("Invalid display_delimiters configuration, using defaults")
-        eq_config["display_delimiters"] = DEFAULT_CONFIG["equations"]["display_delimiters"]
\ No newline at end of file
+        eq_config["display_delimiters"] = list(DEFAULT_CONFIG["equations"]["display_delimiters"])
\ No newline at end of file
@@ -18,32 +18,201 @@ Pipeline order:
  10. generate_yaml_frontmatter  — prepend mdtexpdf YAML frontmatter
 """
 
+import hashlib
+import json
 import os
-import tempfile
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-import pypandoc
-
-from docx2md.processors.cleanup import WordCleanupProcessor
-from docx2md.processors.docx import extract_docx_content
-from docx2md.processors.equation_fix import EquationFixProcessor
-from docx2md.processors.equations import fix_delimiters
-from docx2md.processors.figures import FigureProcessor
-from docx2md.processors.frontmatter import generate_yaml_frontmatter
-from docx2md.processors.images import extract_and_process_images
-from docx2md.processors.tables import process_tables
-from docx2md.processors.unicode_fix import UnicodeFixProcessor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+# Processor modules (and pypandoc / python-docx / Pillow behind them) are
+# imported inside convert_docx_to_markdown, only for the steps that run, so
+# that importing this module — and every CLI command — stays cheap.
+from docx2md import __version__
+from docx2md.utils.file_utils import find_files
 from docx2md.utils.logging_utils import get_logger
+from docx2md.utils.pandoc_utils import convert_docx_to_markdown_text
+
+if TYPE_CHECKING:
+    from docx2md.processors.base import BaseProcessor
 
 logger = get_logger(__name__)
 
+# Batch workers are recycled after this many conversions to bound the memory
+# growth of long batches (pandoc/lxml allocations are not always returned).
+_MAX_TASKS_PER_CHILD = 16
+
+# Image links in the output; the skip_unchanged sidecar checks their targets
+_LOCAL_IMAGE_LINK = re.compile(r'!\[[^\]\n]*\]\(<?([^)\s>]+)')
+
+
+def _worker_init() -> None:
+    """Pre-import the conversion pipeline once per batch worker process."""
+    import pypandoc  # noqa: F401
+
+    import docx2md.processors.cleanup  # noqa: F401
+    import docx2md.processors.docx  # noqa: F401
+    import docx2md.processors.equation_fix  # noqa: F401
+    import docx2md.processors.equations  # noqa: F401
+    import docx2md.processors.figures  # noqa: F401
+    import docx2md.processors.front_matter_structure  # noqa: F401
+    import docx2md.processors.frontmatter  # noqa: F401
+    import docx2md.processors.images  # noqa: F401
+    import docx2md.processors.math_extraction  # noqa: F401
+    import docx2md.processors.tables  # noqa: F401
+    import docx2md.processors.unicode_fix  # noqa: F401
+
+
+def _step_processor(step: str) -> Type["BaseProcessor"]:
+    """Import and return the processor class for a string pipeline step."""
+    if step == "cleanup":
+        # Step 3: Word structural cleanup (TOC, heading markup, image paths)
+        from docx2md.processors.cleanup import WordCleanupProcessor
+        return WordCleanupProcessor
+    if step == "fix_unicode":
+        # Step 4: Unicode → LaTeX replacement
+        from docx2md.processors.unicode_fix import UnicodeFixProcessor
+        return UnicodeFixProcessor
+    if step == "fix_figures":
+        # Step 5: Figure caption fixing (replaces AI alt-text with real captions)
+        from docx2md.processors.figures import FigureProcessor
+        return FigureProcessor
+    if step == "fix_equations":
+        # Step 6: Equation fix (garbled OMML patterns)
+        from docx2md.processors.equation_fix import EquationFixProcessor
+        return EquationFixProcessor
+    raise ValueError(f"Unknown processing step: {step}")
+
+
+def _apply_string_steps(
+    content: str,
+    steps: Tuple[str, ...],
+    config: Dict[str, Any],
+    output_dir: Path,
+) -> str:
+    """Apply the named string processors (pipeline steps 3–6) in order.
+
+    The steps share one PipelineContext, so a math tokenization made by one
+    step is reused by the next for as long as it stays valid.
+    """
+    from docx2md.processors.base import PipelineContext
+
+    ctx = PipelineContext(content)
+    for step in steps:
+        proc: "BaseProcessor"
+        if step == "cleanup":
+            from docx2md.processors.cleanup import WordCleanupProcessor
+            proc = WordCleanupProcessor(config, output_dir=output_dir)
+        else:
+            proc = _step_processor(step)(config)
+        ctx = proc.process_context(ctx)
+    return ctx.content
+
+
+def _conversion_digest(
+    input_path: Path,
+    config: Dict[str, Any],
+    pandoc_args: Sequence[str],
+) -> str:
+    """Hash everything that determines the output of a conversion.
+
+    Covers the .docx bytes, the configuration, the pandoc arguments and the
+    docx2md version.
+    """
+    settings = json.dumps(
+        [config, list(pandoc_args), __version__],
+        sort_keys=True,
+        default=str,
+    )
+    h = hashlib.blake2b(digest_size=16)
+    with open(input_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    h.update(settings.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _output_fingerprint(output_path: Path, images: Sequence[str]) -> Optional[List[Any]]:
+    """Return the size and mtime of *output_path* and the sizes of its *images*.
+
+    *images* are paths relative to the output directory; a missing image is
+    recorded as None. Returns None if the output itself is missing.
+    """
+    try:
+        st = os.stat(output_path)
+    except OSError:
+        return None
+    sizes: List[Optional[int]] = []
+    for image in images:
+        try:
+            sizes.append(os.stat(output_path.parent / image).st_size)
+        except OSError:
+            sizes.append(None)
+    return [st.st_size, st.st_mtime_ns, sizes]
+
+
+def _read_cached_stats(
+    cache_path: Path, digest: str, output_path: Path
+) -> Optional[Dict[str, Any]]:
+    """Return the stats in *cache_path* if they match *digest* and the output.
+
+    The sidecar is only trusted while the output and the images it references
+    are the ones the recorded run wrote.
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("digest") != digest:
+        return None
+    fingerprint = _output_fingerprint(output_path, cached.get("images", []))
+    if fingerprint is None or cached.get("output") != fingerprint:
+        return None
+    return cached.get("stats")
+
+
+def _write_cached_stats(
+    cache_path: Path,
+    digest: str,
+    output_path: Path,
+    markdown_content: str,
+    stats: Dict[str, Any],
+) -> None:
+    """Record *digest*, the output fingerprint and *stats* next to the output."""
+    images = sorted({
+        m.group(1) for m in _LOCAL_IMAGE_LINK.finditer(markdown_content)
+        if "://" not in m.group(1)
+    })
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "digest": digest,
+                    "output": _output_fingerprint(output_path, images),
+                    "images": images,
+                    "stats": stats,
+                },
+                f,
+                default=str,
+            )
+    except OSError as e:
+        logger.warning(f"Could not write conversion cache {cache_path}: {e}")
+
+
+def _pandoc_base_args(config: Dict[str, Any]) -> Tuple[str, ...]:
+    """Return the configured pandoc arguments (everything but --extract-media)."""
+    return tuple(config.get("pandoc", {}).get("extra_args", ("--wrap=none",)))
+
 
 def convert_docx_to_markdown(
     input_file: Union[str, Path],
     output_file: Union[str, Path],
     config: Optional[Dict[str, Any]] = None,
+    pandoc_args: Optional[Sequence[str]] = None,
 ) -> Dict[str, Any]:
     """
     Convert a Word document to Markdown+LaTeX.
@@ -52,9 +221,13 @@ def convert_docx_to_markdown(
         input_file: Path to the Word document (.docx) to convert
         output_file: Path for the output Markdown file
         config: Configuration dictionary (optional)
+        pandoc_args: Pandoc arguments other than --extract-media (optional,
+            defaults to config["pandoc"]["extra_args"])
 
     Returns:
-        Dict containing statistics about the conversion
+        Dict containing statistics about the conversion.  When the output is
+        already up to date (see processing.skip_unchanged) the stats of the
+        run that produced it are returned, with "cached" set to True.
     """
     if config is None:
         config = {}
@@ -70,24 +243,46 @@ def convert_docx_to_markdown(
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    if pandoc_args is None:
+        pandoc_args = _pandoc_base_args(config)
+
+    processing = config.get("processing", {})
+
+    # Opt-in: skip documents whose input and settings are unchanged since the
+    # last run that produced the current output (sidecar "<output>.cache" file)
+    use_cache = processing.get("skip_unchanged", False)
+    cache_path = output_path.with_name(output_path.name + ".cache")
+    if use_cache:
+        digest = _conversion_digest(input_path, config, pandoc_args)
+        cached = _read_cached_stats(cache_path, digest, output_path)
+        if cached is not None:
+            logger.info(f"Unchanged, skipping: {input_path} -> {output_path}")
+            return {**cached, "cached": True}
+    else:
+        # This run replaces the output, so an earlier sidecar no longer describes it
+        try:
+            cache_path.unlink()
+        except FileNotFoundError:
+            pass
+
     logger.info(f"Converting {input_path} to {output_path}")
 
     # Step 1: Extract metadata from the Word document (title, author, etc.)
+    from docx2md.processors.docx import extract_docx_content
     doc_content = extract_docx_content(input_path)
 
     # Step 2: pandoc docx → markdown with image extraction
     media_dir = output_path.parent / config.get("images", {}).get("extract_path", "./img")
     media_dir.mkdir(parents=True, exist_ok=True)
+    media_str = os.fspath(media_dir)
 
-    extra_args = list(config.get("pandoc", {}).get("extra_args", ["--wrap=none"]))
-    extra_args.append(f"--extract-media={media_dir}")
+    extra_args = [*pandoc_args, f"--extract-media={media_str}"]
 
     # Never use --mathml: we want LaTeX $...$ output, not MathML
     # (use_pandoc_mathml is kept in config for backwards compat but defaults False)
 
     stats: Dict[str, Any] = {}
 
-    processing = config.get("processing", {})
     math_extraction_enabled = processing.get("math_extraction", True)
     skip_equation_fix = False
     skip_fix_delimiters = False
@@ -109,24 +304,20 @@ def convert_docx_to_markdown(
             )
         except Exception as e:
             logger.warning(f"Math extraction failed, falling back to pandoc: {e}")
-            markdown_content = pypandoc.convert_file(
-                str(input_path),
-                "markdown",
-                format="docx",
-                extra_args=extra_args,
+            markdown_content = convert_docx_to_markdown_text(
+                input_path, extra_args, tmp_dir=output_path.parent,
             )
     else:
-        markdown_content = pypandoc.convert_file(
-            str(input_path),
-            "markdown",
-            format="docx",
-            extra_args=extra_args,
+        markdown_content = convert_docx_to_markdown_text(
+            input_path, extra_args, tmp_dir=output_path.parent,
         )
 
     # Step 3: Word structural cleanup (TOC, heading markup, image paths)
-    if processing.get("cleanup", True):
-        proc = WordCleanupProcessor(config, output_dir=output_path.parent)
-        markdown_content = proc.process(markdown_content)
+    if (processing.get("cleanup", True)
+            and not _step_processor("cleanup").is_noop(config)):
+        markdown_content = _apply_string_steps(
+            markdown_content, ("cleanup",), config, output_path.parent
+        )
 
     # Step 3b: Detect and structure body front matter (dedication, copyright, title repeats)
     if processing.get("structure_front_matter", True):
@@ -137,80 +328,68 @@ def convert_docx_to_markdown(
             doc_properties=doc_content.get("properties", {}),
         )
 
-    # Step 4: Unicode → LaTeX replacement
-    if processing.get("fix_unicode", True):
-        proc = UnicodeFixProcessor(config)
-        markdown_content = proc.process(markdown_content)
-
-    # Step 5: Figure caption fixing (replaces AI alt-text with real captions)
-    if processing.get("fix_figures", True):
-        proc = FigureProcessor(config)
-        markdown_content = proc.process(markdown_content)
-
-    # Step 6: Equation fix (garbled OMML patterns)
-    # Skipped when math extraction succeeded — equations already clean
-    if processing.get("fix_equations", True) and not skip_equation_fix:
-        proc = EquationFixProcessor(config)
-        markdown_content = proc.process(markdown_content)
-
-    # Steps 7–9: file-based processors (write to temp file, process, read back)
-
-    # Create temp file in the output directory so that the images processor can
-    # resolve relative image paths (e.g. media/media/img.png) correctly.
-    with tempfile.NamedTemporaryFile(
-        suffix=".md", mode="w+", encoding="utf-8", delete=False,
-        dir=output_path.parent,
-    ) as tmp:
-        tmp_path = tmp.name
-        tmp.write(markdown_content)
-
-    try:
-        # Step 7: fix \(...\) → $...$ and \[...\] → $$...$$
-        # Skipped when math extraction succeeded — delimiters already correct
-        if processing.get("fix_delimiters", True) and not skip_fix_delimiters:
-            inline_delimiters = tuple(
-                config.get("equations", {}).get("inline_delimiters", ["$", "$"])
-            )
-            display_delimiters = tuple(
-                config.get("equations", {}).get("display_delimiters", ["$$", "$$"])
-            )
-            eq_stats = fix_delimiters(
-                tmp_path, tmp_path,
-                inline_delimiters=inline_delimiters,
-                display_delimiters=display_delimiters,
-            )
-            stats.update(eq_stats)
-
-        # Step 8: normalize pipe tables
-        if processing.get("process_tables", True):
-            table_stats = process_tables(
-                tmp_path, tmp_path,
-                table_format=config.get("tables", {}).get("format", "pipe"),
-                header_style=config.get("tables", {}).get("header_style", "bold"),
-            )
-            stats.update(table_stats)
-
-        # Step 9: image path cleanup / optimization
-        if processing.get("extract_images", True):
-            img_cfg = config.get("images", {})
-            image_stats = extract_and_process_images(
-                tmp_path, tmp_path,
-                images_dir=str(media_dir),
-                optimize=img_cfg.get("optimize", False),
-                max_width=img_cfg.get("max_width", 1200),
-                max_height=img_cfg.get("max_height", 900),
-            )
-            stats.update(image_stats)
+    # Steps 4–6: Unicode fix, figure captions, equation fix
+    # Equation fix is skipped when math extraction succeeded — equations
+    # already clean.  Steps whose processor is disabled in its own config
+    # section are dropped here rather than scanning the content for nothing.
+    steps = tuple(
+        step for step, enabled in (
+            ("fix_unicode", processing.get("fix_unicode", True)),
+            ("fix_figures", processing.get("fix_figures", True)),
+            ("fix_equations",
+             processing.get("fix_equations", True) and not skip_equation_fix),
+        )
+        if enabled and not _step_processor(step).is_noop(config)
+    )
+    if steps:
+        markdown_content = _apply_string_steps(
+            markdown_content, steps, config, output_path.parent
+        )
 
-        # Read back processed content
-        with open(tmp_path, "r", encoding="utf-8") as f:
-            markdown_content = f.read()
+    # Step 7: fix \(...\) → $...$ and \[...\] → $$...$$
+    # Skipped when math extraction succeeded — delimiters already correct
+    if processing.get("fix_delimiters", True) and not skip_fix_delimiters:
+        from docx2md.processors.equations import fix_delimiters_str
+        inline_delimiters = tuple(
+            config.get("equations", {}).get("inline_delimiters", ["$", "$"])
+        )
+        display_delimiters = tuple(
+            config.get("equations", {}).get("display_delimiters", ["$$", "$$"])
+        )
+        markdown_content, eq_stats = fix_delimiters_str(
+            markdown_content,
+            inline_delimiters=inline_delimiters,
+            display_delimiters=display_delimiters,
+        )
+        stats.update(eq_stats)
 
-    finally:
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
+    # Step 8: normalize pipe tables
+    if processing.get("process_tables", True):
+        from docx2md.processors.tables import process_tables_str
+        markdown_content, table_stats = process_tables_str(
+            markdown_content,
+            table_format=config.get("tables", {}).get("format", "pipe"),
+            header_style=config.get("tables", {}).get("header_style", "bold"),
+        )
+        stats.update(table_stats)
+
+    # Step 9: image path cleanup / optimization
+    # Relative image paths (e.g. media/media/img.png) resolve against the
+    # output directory, where pandoc extracted the media.
+    if processing.get("extract_images", True):
+        from docx2md.processors.images import extract_and_process_images_str
+        img_cfg = config.get("images", {})
+        output_dir = os.path.abspath(output_path.parent)
+        markdown_content, image_stats = extract_and_process_images_str(
+            markdown_content,
+            input_dir=output_dir,
+            output_dir=output_dir,
+            images_dir=media_str,
+            optimize=img_cfg.get("optimize", False),
+            max_width=img_cfg.get("max_width", 1200),
+            max_height=img_cfg.get("max_height", 900),
+        )
+        stats.update(image_stats)
 
     # Step 10: final LaTeX sanitization (runs AFTER fix_delimiters may have
     # introduced new $$ or changed delimiter forms)
@@ -220,6 +399,7 @@ def convert_docx_to_markdown(
 
     # Step 11: prepend YAML frontmatter for mdtexpdf
     if processing.get("generate_frontmatter", True):
+        from docx2md.processors.frontmatter import generate_yaml_frontmatter
         frontmatter, markdown_content = generate_yaml_frontmatter(
             doc_content.get("properties", {}),
             config,
@@ -248,9 +428,9 @@ def convert_docx_to_markdown(
 
     logger.info(f"Conversion completed: {input_path} -> {output_path}")
 
-    return {
-        "input_file": str(input_path),
-        "output_file": str(output_path),
+    result = {
+        "input_file": os.fspath(input_path),
+        "output_file": os.fspath(output_path),
         "equations_count": (
             stats.get("math_equations_extracted", 0)
             or stats.get("inline_fixed", 0) + stats.get("display_fixed", 0)
@@ -259,6 +439,25 @@ def convert_docx_to_markdown(
         "tables_count": stats.get("tables_processed", 0),
         **stats,
     }
+    if use_cache:
+        _write_cached_stats(cache_path, digest, output_path, markdown_content, result)
+    return result
+
+
+def _convert_task(
+    task: Tuple[Path, Path, Dict[str, Any], Tuple[str, ...]],
+) -> Dict[str, Any]:
+    """Convert one batch file, reporting a failure as a result instead of raising.
+
+    Module-level so that it can be sent to batch worker processes.
+    """
+    inp, out, config, pandoc_args = task
+    try:
+        return convert_docx_to_markdown(inp, out, config, pandoc_args)
+    except Exception as e:
+        logger.error(f"Failed to convert {inp}: {e}")
+        return {"input_file": str(inp), "output_file": str(out),
+                "error": str(e), "success": False}
 
 
 def batch_convert(
@@ -292,8 +491,7 @@ def batch_convert(
 
     output_path.mkdir(parents=True, exist_ok=True)
 
-    pattern = "**/*.docx" if recursive else "*.docx"
-    docx_files = list(input_path.glob(pattern))
+    docx_files = find_files(input_path, [".docx"], recursive=recursive)
 
     if not docx_files:
         logger.warning(f"No .docx files found in {input_path}")
@@ -302,39 +500,51 @@ def batch_convert(
     logger.info(f"Found {len(docx_files)} .docx files to process")
 
     conversion_tasks = []
+    created_dirs = {output_path}
     for docx_file in docx_files:
         rel_path = docx_file.relative_to(input_path)
         out_file = output_path / rel_path.with_suffix(".md")
-        out_file.parent.mkdir(parents=True, exist_ok=True)
+        # Files in the same folder share an output directory: create it once
+        if out_file.parent not in created_dirs:
+            out_file.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(out_file.parent)
         conversion_tasks.append((docx_file, out_file))
 
+    # Shared by every file in the batch; only --extract-media varies per file
+    pandoc_args = _pandoc_base_args(config)
+
+    tasks = [(inp, out, config, pandoc_args) for inp, out in conversion_tasks]
     results = []
-    failed_count = 0
-
-    if parallel and len(conversion_tasks) > 1:
-        with ProcessPoolExecutor() as executor:
-            futures = {
-                executor.submit(convert_docx_to_markdown, inp, out, config): (inp, out)
-                for inp, out in conversion_tasks
-            }
-            for future in as_completed(futures):
-                inp, out = futures[future]
-                try:
-                    results.append(future.result())
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(f"Failed to convert {inp}: {e}")
-                    results.append({"input_file": str(inp), "output_file": str(out),
-                                    "error": str(e), "success": False})
-    else:
-        for inp, out in conversion_tasks:
-            try:
-                results.append(convert_docx_to_markdown(inp, out, config))
-            except Exception as e:
-                failed_count += 1
-                logger.error(f"Failed to convert {inp}: {e}")
+
+    if parallel and len(tasks) > 1:
+        max_workers = min(len(tasks), os.cpu_count() or 1)
+        pool_kwargs: Dict[str, Any] = {
+            "max_workers": max_workers,
+            "initializer": _worker_init,
+        }
+        # Only recycle workers when a batch is long enough to need it:
+        # max_tasks_per_child (3.11+) forces the slower "spawn" start method.
+        if (sys.version_info >= (3, 11)
+                and len(tasks) > max_workers * _MAX_TASKS_PER_CHILD):
+            pool_kwargs["max_tasks_per_child"] = _MAX_TASKS_PER_CHILD
+
+        # Send tasks in chunks (the shared config is pickled once per chunk),
+        # keeping about four chunks per worker so uneven files still balance
+        chunksize = max(1, len(tasks) // (max_workers * 4))
+        try:
+            with ProcessPoolExecutor(**pool_kwargs) as executor:
+                for result in executor.map(_convert_task, tasks, chunksize=chunksize):
+                    results.append(result)
+        except BrokenProcessPool as e:
+            # A worker died (e.g. killed for memory): fail what did not finish
+            logger.error(f"Batch worker pool failed: {e}")
+            for inp, out, _, _ in tasks[len(results):]:
                 results.append({"input_file": str(inp), "output_file": str(out),
-                                 "error": str(e), "success": False})
+                                "error": str(e), "success": False})
+    else:
+        results = [_convert_task(task) for task in tasks]
+
+    failed_count = sum(1 for r in results if r.get("success") is False)
 
     return {
         "files_processed": len(conversion_tasks),
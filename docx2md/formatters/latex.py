@@ -4,7 +4,7 @@ LaTeX formatter for docx2md.
 This module provides functions for formatting LaTeX content within Markdown.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from docx2md.utils.logging_utils import get_logger
 
@@ -25,6 +25,16 @@ def format_math_environment(equation: str, environment: str = "equation") -> str
     return f"\\begin{{{environment}}}\n{equation}\n\\end{{{environment}}}"
 
 
+def _align_equation(eq: str) -> str:
+    """Add an alignment marker at the first '=' if missing, drop any line break."""
+    if "&" not in eq:
+        lhs, eq_sign, rhs = eq.partition("=")
+        if eq_sign:
+            eq = f"{lhs} &= {rhs}"
+    # str.removesuffix needs 3.9; mypy and black target 3.8
+    return (eq[:-2] if eq.endswith("\\\\") else eq).rstrip()
+
+
 def format_aligned_equations(equations: List[str], numbered: bool = False) -> str:
     """
     Format aligned equations in LaTeX.
@@ -38,28 +48,8 @@ def format_aligned_equations(equations: List[str], numbered: bool = False) -> st
     """
     env = "align" if numbered else "align*"
     
-    # Join equations with line breaks and alignment markers
-    aligned_content = []
-    for eq in equations:
-        if "&" not in eq:
-            # Add alignment marker if not present
-            parts = eq.split("=", 1)
-            if len(parts) > 1:
-                aligned_content.append(f"{parts[0]} &= {parts[1]} \\\\")
-            else:
-                aligned_content.append(f"{eq} \\\\")
-        else:
-            # Already has alignment marker
-            if not eq.endswith("\\\\"):
-                aligned_content.append(f"{eq} \\\\")
-            else:
-                aligned_content.append(eq)
-    
-    # Remove trailing \\ from the last line
-    if aligned_content and aligned_content[-1].endswith("\\\\"):
-        aligned_content[-1] = aligned_content[-1][:-2]
-    
-    content = "\n".join(aligned_content)
+    # Join equations with line breaks; join() leaves the last line without one
+    content = " \\\\\n".join([_align_equation(eq) for eq in equations])
     
     return f"\\begin{{{env}}}\n{content}\n\\end{{{env}}}"
 
@@ -75,13 +65,8 @@ def format_matrix(matrix: List[List[str]], environment: str = "pmatrix") -> str:
     Returns:
         Formatted LaTeX matrix
     """
-    # Convert each row to LaTeX format
-    rows = []
-    for row in matrix:
-        rows.append(" & ".join(row) + " \\\\")
-    
-    # Join rows with newlines
-    content = "\n".join(rows)
+    # Convert each row to LaTeX format and join rows with newlines
+    content = "\n".join([" & ".join(row) + " \\\\" for row in matrix])
     
     return f"\\begin{{{environment}}}\n{content}\n\\end{{{environment}}}"
 
@@ -228,14 +213,10 @@ def format_cases(cases: List[Tuple[str, str]]) -> str:
     Returns:
         Formatted LaTeX cases
     """
-    case_lines = []
-    for expr, cond in cases:
-        if cond:
-            case_lines.append(f"{expr} & \\text{{{cond}}} \\\\")
-        else:
-            case_lines.append(f"{expr} & \\\\")
-    
-    content = "\n".join(case_lines)
+    content = "\n".join([
+        f"{expr} & \\text{{{cond}}} \\\\" if cond else f"{expr} & \\\\"
+        for expr, cond in cases
+    ])
     
     return f"\\begin{{cases}}\n{content}\n\\end{{cases}}"
 
@@ -286,6 +267,21 @@ def format_chemical_equation(equation: str) -> str:
     return f"\\ce{{{equation}}}"
 
 
+# Characters that need to be escaped in LaTeX
+_LATEX_ESCAPE_TABLE = str.maketrans({
+    '&': '\\&',
+    '%': '\\%',
+    '$': '\\$',
+    '#': '\\#',
+    '_': '\\_',
+    '{': '\\{',
+    '}': '\\}',
+    '~': '\\textasciitilde{}',
+    '^': '\\textasciicircum{}',
+    '\\': '\\textbackslash{}',
+})
+
+
 def escape_latex(text: str) -> str:
     """
     Escape special LaTeX characters in text.
@@ -296,22 +292,4 @@ def escape_latex(text: str) -> str:
     Returns:
         Escaped text
     """
-    # Characters that need to be escaped in LaTeX
-    special_chars = {
-        '&': '\\&',
-        '%': '\\%',
-        '$': '\\$',
-        '#': '\\#',
-        '_': '\\_',
-        '{': '\\{',
-        '}': '\\}',
-        '~': '\\textasciitilde{}',
-        '^': '\\textasciicircum{}',
-        '\\': '\\textbackslash{}',
-    }
-    
-    # Escape each special character
-    for char, replacement in special_chars.items():
-        text = text.replace(char, replacement)
-    
-    return text
\ No newline at end of file
+    return text.translate(_LATEX_ESCAPE_TABLE)
@@ -4,12 +4,23 @@ Markdown formatter for docx2md.
 This module provides functions for formatting content as Markdown.
 """
 
+import functools
 from typing import Any, Dict, List, Optional, Union
 
 from docx2md.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Short inline wrappers are called with the same few tokens over and over;
+# cached results skip the string formatting for repeats.
+_inline_cache = functools.lru_cache(maxsize=4096)
+
+_HORIZONTAL_RULE = "---"
+
+# Heading markers by level (index 0 unused) and list indents for common depths
+_HEADING_PREFIX = ("", "# ", "## ", "### ", "#### ", "##### ", "###### ")
+_LIST_INDENT = tuple("  " * level for level in range(8))
+
 
 def format_heading(text: str, level: int = 1) -> str:
     """
@@ -25,9 +36,10 @@ def format_heading(text: str, level: int = 1) -> str:
     # Ensure level is between 1 and 6
     level = max(1, min(6, level))
     
-    return f"{'#' * level} {text}"
+    return f"{_HEADING_PREFIX[level]}{text}"
 
 
+@_inline_cache
 def format_bold(text: str) -> str:
     """
     Format text as bold in Markdown.
@@ -41,6 +53,7 @@ def format_bold(text: str) -> str:
     return f"**{text}**"
 
 
+@_inline_cache
 def format_italic(text: str) -> str:
     """
     Format text as italic in Markdown.
@@ -71,6 +84,7 @@ def format_code(text: str, language: Optional[str] = None) -> str:
         return f"```\n{text}\n```"
 
 
+@_inline_cache
 def format_inline_code(text: str) -> str:
     """
     Format text as inline code in Markdown.
@@ -127,7 +141,7 @@ def format_list_item(text: str, level: int = 0) -> str:
     Returns:
         Formatted list item
     """
-    indent = "  " * level
+    indent = _LIST_INDENT[level] if 0 <= level < len(_LIST_INDENT) else "  " * level
     return f"{indent}- {text}"
 
 
@@ -143,7 +157,7 @@ def format_numbered_list_item(text: str, number: int, level: int = 0) -> str:
     Returns:
         Formatted numbered list item
     """
-    indent = "  " * level
+    indent = _LIST_INDENT[level] if 0 <= level < len(_LIST_INDENT) else "  " * level
     return f"{indent}{number}. {text}"
 
 
@@ -158,9 +172,7 @@ def format_blockquote(text: str) -> str:
         Formatted blockquote
     """
     # Add '> ' to the beginning of each line
-    lines = text.split('\n')
-    quoted_lines = [f"> {line}" for line in lines]
-    return '\n'.join(quoted_lines)
+    return "> " + text.replace('\n', '\n> ')
 
 
 def format_horizontal_rule() -> str:
@@ -170,13 +182,24 @@ def format_horizontal_rule() -> str:
     Returns:
         Formatted horizontal rule
     """
-    return "---"
+    return _HORIZONTAL_RULE
+
+
+# A literal pipe inside a cell would end the cell early
+_TABLE_CELL_ESCAPE = str.maketrans({"|": "\\|"})
+
+# Separator cell for each column alignment (left is the default)
+_ALIGNMENT_CELLS = {"left": ":---", "center": ":---:", "right": "---:"}
 
 
 def format_table(headers: List[str], rows: List[List[str]], alignments: Optional[List[str]] = None) -> str:
     """
     Format a table in Markdown.
     
+    A literal "|" in a header or data cell is escaped as "\\|", including
+    inside inline math ("$a|b$" becomes "$a\\|b$"), since an unescaped pipe
+    would end the cell.
+    
     Args:
         headers: List of header texts
         rows: List of rows, each a list of cell texts
@@ -191,18 +214,10 @@ def format_table(headers: List[str], rows: List[List[str]], alignments: Optional
     # Determine column count
     col_count = len(headers)
     
-    # Ensure all rows have the same number of columns
-    normalized_rows = []
-    for row in rows:
-        if len(row) < col_count:
-            # Pad with empty cells
-            normalized_rows.append(row + [""] * (col_count - len(row)))
-        else:
-            # Truncate if too long
-            normalized_rows.append(row[:col_count])
-    
     # Create header row
-    header_row = "| " + " | ".join(headers) + " |"
+    header_row = "| " + " | ".join(
+        [cell.translate(_TABLE_CELL_ESCAPE) for cell in headers]
+    ) + " |"
     
     # Create separator row with alignments
     if not alignments:
@@ -211,24 +226,23 @@ def format_table(headers: List[str], rows: List[List[str]], alignments: Optional
         # Ensure alignments list has the right length
         alignments = alignments[:col_count] + ["left"] * (col_count - len(alignments))
     
-    separator_cells = []
-    for alignment in alignments:
-        if alignment == "center":
-            separator_cells.append(":---:")
-        elif alignment == "right":
-            separator_cells.append("---:")
-        else:  # left or default
-            separator_cells.append(":---")
-    
-    separator_row = "| " + " | ".join(separator_cells) + " |"
+    separator_row = "| " + " | ".join(
+        _ALIGNMENT_CELLS.get(alignment, ":---") for alignment in alignments
+    ) + " |"
     
-    # Create data rows
-    data_rows = []
-    for row in normalized_rows:
-        data_rows.append("| " + " | ".join(row) + " |")
+    # Create data rows, padding short rows with empty cells and truncating
+    # long ones so every row has the same number of columns
+    lines = [header_row, separator_row]
+    lines += [
+        "| " + " | ".join(
+            [cell.translate(_TABLE_CELL_ESCAPE) for cell in row[:col_count]]
+            + [""] * (col_count - len(row))
+        ) + " |"
+        for row in rows
+    ]
     
     # Combine all rows
-    return "\n".join([header_row, separator_row] + data_rows)
+    return "\n".join(lines)
 
 
 def format_definition(term: str, definition: str) -> str:
@@ -245,6 +259,7 @@ def format_definition(term: str, definition: str) -> str:
     return f"{term}\n: {definition}"
 
 
+@_inline_cache
 def format_footnote_reference(identifier: str) -> str:
     """
     Format a footnote reference in Markdown.
@@ -270,14 +285,12 @@ def format_footnote_definition(identifier: str, text: str) -> str:
         Formatted footnote definition
     """
     # Indent all lines after the first
-    lines = text.split('\n')
-    if len(lines) > 1:
-        indented_lines = [lines[0]] + [f"    {line}" for line in lines[1:]]
-        text = '\n'.join(indented_lines)
+    text = text.replace('\n', '\n    ')
     
     return f"[^{identifier}]: {text}"
 
 
+@_inline_cache
 def format_math_inline(equation: str) -> str:
     """
     Format an inline math equation in Markdown.
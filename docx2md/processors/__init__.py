@@ -3,13 +3,20 @@ Processor modules for docx2md.
 
 These modules handle specific aspects of the conversion process,
 such as equations, images, tables, and references.
+
+The processor classes below are imported on first access, so importing one
+processor module (which imports this package first) does not load the rest.
 """
 
-from docx2md.processors.cleanup import WordCleanupProcessor
-from docx2md.processors.equation_fix import EquationFixProcessor
-from docx2md.processors.figures import FigureProcessor
-from docx2md.processors.math_extraction import MathExtractor
-from docx2md.processors.unicode_fix import UnicodeFixProcessor
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from docx2md.processors.cleanup import WordCleanupProcessor
+    from docx2md.processors.equation_fix import EquationFixProcessor
+    from docx2md.processors.figures import FigureProcessor
+    from docx2md.processors.math_extraction import MathExtractor
+    from docx2md.processors.unicode_fix import UnicodeFixProcessor
 
 __all__ = [
     "WordCleanupProcessor",
@@ -17,4 +24,27 @@ __all__ = [
     "FigureProcessor",
     "MathExtractor",
     "UnicodeFixProcessor",
-]
\ No newline at end of file
+]
+
+# Exported name -> submodule that defines it
+_SUBMODULES = {
+    "WordCleanupProcessor": "cleanup",
+    "EquationFixProcessor": "equation_fix",
+    "FigureProcessor": "figures",
+    "MathExtractor": "math_extraction",
+    "UnicodeFixProcessor": "unicode_fix",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_SUBMODULES[name]}")
+    value = getattr(module, name)
+    # Cache in the module namespace so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,14 +5,43 @@ This module defines the base processor class that all specific processors
 should inherit from.
 """
 
+import os
+import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple, Union
 from pathlib import Path
 
 from docx2md.utils.logging_utils import get_logger
+from docx2md.utils.math_utils import tokenize_math_spans
 
 logger = get_logger(__name__)
 
+# Buffer size for streamed files, and roughly how much text a line-oriented
+# processor handles per process() call
+_STREAM_CHUNK = 1 << 20
+
+
+@dataclass
+class PipelineContext:
+    """
+    Content handed from one string processor to the next.
+    
+    tokens, when set, is tokenize_math_spans(content): processors that work
+    on math spans keep it up to date so the next one need not rescan, and
+    any other change to content drops it.
+    """
+    
+    content: str
+    tokens: Optional[List[Tuple[str, str]]] = None
+    
+    def math_tokens(self) -> List[Tuple[str, str]]:
+        """Return the math/text tokens of the content, tokenizing at most once."""
+        if self.tokens is None:
+            self.tokens = tokenize_math_spans(self.content)
+        return self.tokens
+
 
 class BaseProcessor(ABC):
     """
@@ -21,6 +50,13 @@ class BaseProcessor(ABC):
     This abstract class defines the interface that all processors must implement.
     """
     
+    # Shared by all instances; subclasses may set their own
+    logger = logger
+    
+    # True if process() never needs to see past the end of a line, so the
+    # content can be processed in chunks of whole lines
+    line_oriented = False
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the processor.
@@ -29,7 +65,22 @@ class BaseProcessor(ABC):
             config: Configuration dictionary
         """
         self.config = config or {}
-        self.logger = logger
+    
+    @classmethod
+    def is_noop(cls, config: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check whether processing with this configuration would change nothing.
+        
+        Callers use this to skip constructing the processor and scanning the
+        content at all.
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            True if process() would return its input unchanged
+        """
+        return False
     
     @abstractmethod
     def process(self, content: str) -> str:
@@ -44,6 +95,46 @@ class BaseProcessor(ABC):
         """
         pass
     
+    def process_context(self, ctx: PipelineContext) -> PipelineContext:
+        """
+        Process the content of a pipeline context in place.
+        
+        The default runs process() and keeps the tokens only if the content
+        came back unchanged; processors working on math tokens override it.
+        
+        Args:
+            ctx: Pipeline context
+            
+        Returns:
+            The same context, updated
+        """
+        content = self.process(ctx.content)
+        if content != ctx.content:
+            ctx.content = content
+            ctx.tokens = None
+        return ctx
+    
+    def process_stream(self, reader: IO[str], writer: IO[str]) -> None:
+        """
+        Process text from a reader and write the result to a writer.
+        
+        Line-oriented processors handle the text in chunks of whole lines, so
+        only one chunk is held in memory at a time; others process it whole.
+        
+        Args:
+            reader: Text stream to read the content from
+            writer: Text stream to write the processed content to
+        """
+        if not self.line_oriented:
+            writer.write(self.process(reader.read()))
+            return
+        
+        while True:
+            lines = reader.readlines(_STREAM_CHUNK)
+            if not lines:
+                break
+            writer.write(self.process("".join(lines)))
+    
     def process_file(
         self,
         input_file: Union[str, Path],
@@ -65,16 +156,42 @@ class BaseProcessor(ABC):
         self.logger.info(f"Processing file: {input_path}")
         
         try:
-            # Read input file
-            with open(input_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            # Process content
-            processed_content = self.process(content)
-            
-            # Write output file
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(processed_content)
+            if self.line_oriented and not _same_file(input_path, output_path):
+                # Stream through large buffers instead of holding the whole
+                # input and output in memory.  The result goes to a temporary
+                # file next to the output and replaces it only once complete,
+                # so a failure never leaves a truncated output behind.  It is
+                # created with open() rather than mkstemp() so it gets the
+                # usual umask permissions instead of 0600.
+                tmp_path = output_path.with_name(
+                    f".{output_path.name}.{uuid.uuid4().hex}.tmp"
+                )
+                try:
+                    with open(input_path, "r", encoding="utf-8",
+                              buffering=_STREAM_CHUNK) as fi, \
+                            open(tmp_path, "x", encoding="utf-8", newline="\n",
+                                 buffering=_STREAM_CHUNK) as fo:
+                        self.process_stream(fi, fo)
+                    os.replace(tmp_path, output_path)
+                except BaseException:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                    raise
+            else:
+                # Read input file: one read of the raw bytes and one decode is
+                # cheaper than text mode's chunked incremental decoder
+                content = input_path.read_bytes().decode("utf-8")
+                if "\r" in content:
+                    # Same newline handling as text mode
+                    content = content.replace("\r\n", "\n").replace("\r", "\n")
+                
+                # Process content
+                processed_content = self.process(content)
+                
+                # Write output file (always with \n line endings)
+                output_path.write_bytes(processed_content.encode("utf-8"))
             
             self.logger.info(f"Processed file saved to: {output_path}")
             
@@ -91,4 +208,45 @@ class BaseProcessor(ABC):
                 "input_file": str(input_path),
                 "output_file": str(output_path),
                 "error": str(e),
-            }
\ No newline at end of file
+            }
+    
+    def process_files(
+        self,
+        pairs: Sequence[Tuple[Union[str, Path], Optional[Union[str, Path]]]],
+        max_workers: int = 8,
+        use_processes: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several files concurrently.
+        
+        Threads overlap the file I/O of one file with the processing of
+        another; use_processes runs the files in separate processes instead,
+        for processors whose regex work dominates (the processor must then be
+        picklable).
+        
+        Args:
+            pairs: (input_file, output_file) pairs, as for process_file
+            max_workers: Maximum number of concurrent workers
+            use_processes: Whether to use processes instead of threads
+            
+        Returns:
+            One process_file result per pair, in the same order
+        """
+        if len(pairs) <= 1 or max_workers <= 1:
+            return [self.process_file(inp, out) for inp, out in pairs]
+        
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=min(max_workers, len(pairs))) as executor:
+            return list(executor.map(
+                self.process_file,
+                [inp for inp, _ in pairs],
+                [out for _, out in pairs],
+            ))
+
+
+def _same_file(a: Path, b: Path) -> bool:
+    """Check whether two paths name the same file (writing b would truncate a)."""
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
@@ -9,6 +9,10 @@ Removes Word-specific artifacts from raw pandoc markdown output:
 - Image size attributes ({width="..." height="..."})
 - Absolute image paths → relative paths
 - Structural LaTeX validation (brace balance in captions, double subscripts)
+
+The processor holds only plain configuration, so it pickles for process
+pools (BaseProcessor.process_files, batch conversion); each worker compiles
+the module-level patterns once on import.
 """
 
 import os
@@ -16,6 +20,8 @@ import re
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import regex
+
 from docx2md.processors.base import BaseProcessor
 from docx2md.utils.logging_utils import get_logger
 
@@ -31,24 +37,27 @@ logger = get_logger(__name__)
 # Both end with exactly three consecutive $ signs.  LaTeX errors result when
 # pandoc re-encodes these as \[ ... \] with $ inside.
 #
+# The patterns that open on a $ run or sit behind a lookbehind are compiled
+# with the `regex` module, which matches them several times faster than `re`
+# on long documents.  The rest stay on `re`, which is faster for them.
+#
+# Pattern C – four or more consecutive $ collapsed to $$ (edge case
+# triple/quad overlap).  Applied first: the $$ it leaves can complete an A match.
+_P_DOLLAR_RUN = regex.compile(r'(?<!\$)\${4,}')
+
 # Pattern A – two inline-math spans followed by orphan $$
 #   $X$$Y$$$  →  $X$   (keep LaTeX version, drop text label + orphan opener)
-_P_TRIPLE_DOLLAR_A = re.compile(
-    r'(\$[^$\n]+\$)'    # group 1: first inline math (LaTeX-formatted)
-    r'\$[^$\n]+\$'      # second inline math (text label – discard)
-    r'\$\$(?!\$)',       # orphan display opener $$ (not $$$$)
-)
-
 # Pattern B – stray $ immediately before a display math span
 #   $$$X$$  →  $$X$$
-_P_TRIPLE_DOLLAR_B = re.compile(
-    r'(?<!\$)\$(?=\$\$(?!\$))',  # lone $ right before $$...  but not $$$$
+# B only matches the first $ of a run of exactly three, which an A match can
+# contain only at its very end, so both are applied in a single pass.
+_P_TRIPLE_DOLLAR_AB = regex.compile(
+    r'(\$[^$\n]+\$)'    # A, group 1: first inline math (LaTeX-formatted)
+    r'\$[^$\n]+\$'         # second inline math (text label – discard)
+    r'\$\$(?!\$)'          # orphan display opener $$ (not $$$$)
+    r'|(?<!\$)\$(?=\$\$(?!\$))',  # B: lone $ right before $$...  but not $$$$
 )
 
-# Pattern C – five+ consecutive $ collapsed to $$ (edge case triple/quad overlap)
-_P_MANY_DOLLARS = re.compile(r'\${5,}')
-_P_FOUR_DOLLARS = re.compile(r'(?<!\$)\$\$\$\$(?!\$)')
-
 # Pattern D – $$WORD$$ text label followed immediately by raw LaTeX commands.
 # Word stores variable definitions like "for unitary U ∈ ℂ^{m×m}" as two equations:
 # a text label ("Unitary") and the actual math ("U ∈ ℂ^{m×m}").  Pandoc produces:
@@ -58,7 +67,7 @@ _P_FOUR_DOLLARS = re.compile(r'(?<!\$)\$\$\$\$(?!\$)')
 # and wrap the raw-LaTeX tail in inline math $...$:
 #   for unitary $\ U \in \mathbb{C}^{m \times m}$
 # Matches: anything on the line, then $$WORD$$, then tail starting with backslash.
-_P_WORD_LABEL_INLINE = re.compile(
+_P_WORD_LABEL_INLINE = regex.compile(
     r'(?m)'                      # multiline: ^ $ match line start/end
     r'^(.+?)'                    # group 1: text before $$WORD$$
     r'\$\$([A-Za-z]+)\$\$'       # $$WORD$$ text label (alphabetic only)
@@ -66,6 +75,13 @@ _P_WORD_LABEL_INLINE = re.compile(
     r'\$?$'                      # optional orphan $ before end of line (discard it)
 )
 
+# The part of a Pattern D match that starts with a literal: $$WORD$$\ .
+# Used to find the few lines worth running _P_WORD_LABEL_INLINE on.
+_P_WORD_LABEL_SEED = re.compile(r'\$\$[A-Za-z]+\$\$\\')
+
+# Every Pattern A/B match contains $$$ and neither crosses a newline
+_P_TRIPLE_DOLLAR_SEED = re.compile(r'\$\$\$')
+
 # Pattern E – double subscript from Word's nested equation encoding.
 # Word produces e.g. {{\widehat{X}}_{1}}_{1,j} — two subscripts on the same
 # base.  LaTeX errors: "! Double subscript."  Fix: insert {} between them so
@@ -116,8 +132,11 @@ _P_MATH_GLUED_AFTER = re.compile(
 # Pattern J – Word text label glued to inline math of the same word:
 #   "unitary$Unitary$" → "unitary" (remove duplicate math label)
 # Word stores both plain text and an equation label for the same word.
+# The lookbehind only lets a match start at the beginning of a word: if the
+# whole word fails, so does every suffix of it, and without the guard the
+# engine would rescan the word from each letter.
 _P_WORD_TEXT_LABEL = re.compile(
-    r'([a-zA-Z]{2,})\$([a-zA-Z]+)\$',
+    r'(?<![a-zA-Z])([a-zA-Z]{2,})\$([a-zA-Z]+)\$',
 )
 
 # Pattern K – broken inline math with space after opening $: $ n → $n
@@ -129,7 +148,7 @@ _P_WORD_TEXT_LABEL = re.compile(
 # letters, digits, }, ), ], \) and $$ display math (preceded by $).
 # Opening $ is preceded by whitespace, formatting chars (*_), punctuation,
 # or start-of-line — none of which are in the exclusion set.
-_P_SPACE_AFTER_OPEN_DOLLAR = re.compile(
+_P_SPACE_AFTER_OPEN_DOLLAR = regex.compile(
     r'(?<![a-zA-Z0-9})\]\\$])\$ ([a-zA-Z\\])',
 )
 
@@ -142,12 +161,20 @@ _TOC_HEADING = re.compile(
 
 # Matches heading lines (one or more # followed by space and content)
 _HEADING_LINE = re.compile(r'^(#+)\s+(.+)$')
+# Bold/italic markers wrapping the first segment of heading text, either
+# followed by whitespace (e.g. before math) or spanning the whole text
+_HEADING_STAR_MID = re.compile(r'^\*{1,3}(.*?)\*{1,3}(\s)')
+_HEADING_STAR_END = re.compile(r'^\*{1,3}(.*?)\*{1,3}$')
+
+# Both line patterns below open with a literal character followed by a
+# "first on its line" lookbehind rather than ^, so the regex engine can scan
+# for that character instead of attempting a match at every position.
 
 # Empty headings: lines with only # characters and optional whitespace
-_EMPTY_HEADING = re.compile(r'^#+\s*$', re.MULTILINE)
+_EMPTY_HEADING = re.compile(r'#(?<![^\n]#)#*\s*$', re.MULTILINE)
 
 # Empty bracket artifacts: standalone [] on a line (from empty Word links/images)
-_EMPTY_BRACKETS = re.compile(r'^\[\]\s*$', re.MULTILINE)
+_EMPTY_BRACKETS = re.compile(r'\[(?<![^\n]\[)\]\s*$', re.MULTILINE)
 
 # Matches {#word-id} optionally followed by class attributes like .unnumbered
 _HEADING_ID = re.compile(r'\{#[a-zA-Z0-9_-]+([^}]*)\}')
@@ -157,6 +184,13 @@ _IMAGE_SIZE_ATTRS = re.compile(
     r'(!\[[^\]]*\]\([^)]+\))\{(?:width|height)="[^"]*"(?:\s+(?:width|height)="[^"]*")?\}',
 )
 
+# Math span in image alt text: an unescaped $ up to the next $, or (with no
+# closing $) up to the end of the text
+_ALT_MATH_SPAN = re.compile(r'(?<!\\)\$(?:([^$]*)\$|[^$]*\Z)')
+
+# Display math block $$...$$ (non-greedy, may span lines)
+_DISPLAY_MATH_BLOCK = re.compile(r'\$\$(.*?)\$\$', re.DOTALL)
+
 # Image markdown reference: ![alt](path)
 _IMAGE_REF = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
 
@@ -198,20 +232,24 @@ class WordCleanupProcessor(BaseProcessor):
         # Must run first – $$$  corrupts math tokenizers downstream
         if self.strip_triple_dollar:
             content = _strip_triple_dollar(content)
+        # The substring checks below are cheap necessary conditions for each
+        # pass, so documents without the artifact skip the regex entirely
         if self.remove_toc:
             content = _remove_toc(content)
-        if self.strip_heading_markup:
+        if self.strip_heading_markup and '#' in content:
             content = _strip_heading_markup(content)
-        if self.strip_heading_ids:
+        if self.strip_heading_ids and '{#' in content:
             content = _strip_heading_ids(content)
-        if self.remove_image_attrs:
+        if self.remove_image_attrs and ('{width=' in content or '{height=' in content):
             content = _IMAGE_SIZE_ATTRS.sub(r'\1', content)
-        if self.fix_image_paths:
+        if self.fix_image_paths and '![' in content:
             content = _fix_image_paths(content, self.output_dir)
         # Strip empty headings (## with no text) — Word section break artifacts
-        content = _EMPTY_HEADING.sub('', content)
+        if '#' in content:
+            content = _EMPTY_HEADING.sub('', content)
         # Strip empty bracket artifacts [] on standalone lines
-        content = _EMPTY_BRACKETS.sub('', content)
+        if '[]' in content:
+            content = _EMPTY_BRACKETS.sub('', content)
         return content
 
 
@@ -222,25 +260,43 @@ def _remove_toc(content: str) -> str:
     Drops the TOC heading and all following TOC link lines until the next
     real heading (a heading line that doesn't contain a pandoc TOC link).
     """
-    lines = content.split('\n')
-    result = []
+    # Only heading lines can start or end a TOC block, so jump between lines
+    # starting with # and slice the document instead of splitting it
+    pieces = []
+    keep_from = 0
+    toc_start = 0
     in_toc = False
 
-    for line in lines:
+    # find() + 1 is 0 when there is no further heading: map that to -1
+    start = 0 if content.startswith('#') else content.find('\n#') + 1 or -1
+    while start != -1:
+        end = content.find('\n', start)
+        if end == -1:
+            end = len(content)
+        line = content[start:end]
+
         if _TOC_HEADING.match(line):
-            in_toc = True
-            continue  # drop TOC heading itself
-
-        if in_toc:
-            # A real heading that is NOT a TOC hyperlink ends the block
-            if _HEADING_LINE.match(line) and '](#' not in line:
-                in_toc = False
-                result.append(line)
-            # Otherwise silently drop TOC content (links, blank lines)
-        else:
-            result.append(line)
+            if not in_toc:
+                toc_start = start
+                in_toc = True
+        # A real heading that is NOT a TOC hyperlink ends the block
+        elif in_toc and _HEADING_LINE.match(line) and '](#' not in line:
+            pieces.append(content[keep_from:toc_start])
+            keep_from = start
+            in_toc = False
+
+        start = content.find('\n#', end) + 1 or -1
+
+    if not pieces and not in_toc:
+        return content
 
-    return '\n'.join(result)
+    if in_toc:
+        # TOC runs to the end: also drop the newline ending the last kept line
+        pieces.append(content[keep_from:toc_start])
+        return ''.join(pieces)[:-1]
+
+    pieces.append(content[keep_from:])
+    return ''.join(pieces)
 
 
 def _strip_heading_markup(content: str) -> str:
@@ -254,18 +310,21 @@ def _strip_heading_markup(content: str) -> str:
     lines = content.split('\n')
     result = []
     for line in lines:
-        m = _HEADING_LINE.match(line)
+        m = _HEADING_LINE.match(line) if line.startswith('#') else None
         if m:
             hashes = m.group(1)
             text = m.group(2)
             # Iteratively strip leading/trailing *** ** * from first text segment
-            # Stop when text doesn't change (avoids infinite loop on nested markers)
-            prev = None
-            while prev != text:
+            # Stop when text doesn't change (avoids infinite loop on nested markers).
+            # Both patterns are anchored on a leading *, so plain headings skip
+            # the regex engine entirely.
+            while text.startswith('*'):
                 prev = text
                 # Strip *** bold-italic wrapping the first segment (may be followed by math)
-                text = re.sub(r'^\*{1,3}(.*?)\*{1,3}(\s)', r'\1\2', text)
-                text = re.sub(r'^\*{1,3}(.*?)\*{1,3}$', r'\1', text)
+                text = _HEADING_STAR_MID.sub(r'\1\2', text)
+                text = _HEADING_STAR_END.sub(r'\1', text)
+                if text == prev:
+                    break
             result.append(f'{hashes} {text}')
         else:
             result.append(line)
@@ -293,17 +352,38 @@ def _fix_image_paths(content: str, output_dir: Path) -> str:
     """
     Convert absolute image paths to paths relative to output_dir.
     """
+    output_dir_str = os.fspath(output_dir)
+    # On POSIX, a normalized path under output_dir is relative by slicing off
+    # the prefix; everything else goes through os.path.relpath
+    out_prefix = None
+    if os.sep == '/':
+        out_prefix = os.path.join(os.path.abspath(output_dir_str), '')
+    # path as written → relative path, or None to leave the reference as-is
+    # (documents often repeat the same image, e.g. a logo)
+    rel_paths: Dict[str, Optional[str]] = {}
+
     def _replace(match: re.Match) -> str:
         alt = match.group(1)
         path_str = match.group(2)
-        p = Path(path_str)
-        if p.is_absolute():
-            try:
-                rel = os.path.relpath(p, output_dir)
-                return f'![{alt}]({rel})'
-            except ValueError:
-                pass  # different drive on Windows — leave as-is
-        return match.group(0)
+        if path_str in rel_paths:
+            rel = rel_paths[path_str]
+        else:
+            rel = None
+            tail = ''
+            if out_prefix and path_str.startswith(out_prefix):
+                tail = path_str[len(out_prefix):]
+            if (tail and not tail.startswith(('.', '/')) and not tail.endswith('/')
+                    and '/.' not in tail and '//' not in tail):
+                rel = tail
+            elif Path(path_str).is_absolute():
+                try:
+                    rel = os.path.relpath(path_str, output_dir_str)
+                except ValueError:
+                    pass  # different drive on Windows — leave as-is
+            rel_paths[path_str] = rel
+        if rel is None:
+            return match.group(0)
+        return f'![{alt}]({rel})'
 
     return _IMAGE_REF.sub(_replace, content)
 
@@ -323,37 +403,48 @@ def _strip_triple_dollar(content: str) -> str:
 
     pdflatex errors on these because $ is illegal inside \\[...\\] display mode.
     """
-    # Edge case: 5+ consecutive $ → reduce to $$
-    content = _P_MANY_DOLLARS.sub('$$', content)
-
-    # Edge case: exactly 4 consecutive $ (adjacent display math) → $$
-    content = _P_FOUR_DOLLARS.sub('$$', content)
+    # Edge cases: 4+ consecutive $ (adjacent display math) → $$
+    # Must run before A/B: the $$ it leaves can complete an A match
+    if '$$$$' in content:
+        content = _P_DOLLAR_RUN.sub('$$', content)
 
     # Pattern A: $X$$Y$$$  →  $X$
-    # Keep the first (LaTeX) inline math, drop text label and orphan $$
-    content = _P_TRIPLE_DOLLAR_A.sub(r'\1', content)
-
+    #   Keep the first (LaTeX) inline math, drop text label and orphan $$
     # Pattern B: $$$X$$  →  $$X$$
-    # Remove stray $ immediately before a display math span
-    content = _P_TRIPLE_DOLLAR_B.sub('', content)
+    #   Remove stray $ immediately before a display math span
+    # (group 1 is unset for B, which expands to an empty string)
+    if '$$$' in content:
+        content = _sub_seeded_lines(
+            content, _P_TRIPLE_DOLLAR_SEED, _P_TRIPLE_DOLLAR_AB, r'\1'
+        )
 
     # Pattern D: TEXT$$WORD$$\LATEX...  →  TEXT $\LATEX...$
     # Remove inline text-label $$WORD$$ and wrap the raw-LaTeX tail in inline math.
-    content = _P_WORD_LABEL_INLINE.sub(
-        lambda m: f'{m.group(1)} ${m.group(3)}$', content
-    )
+    if '$$' in content:
+        content = _sub_seeded_lines(
+            content, _P_WORD_LABEL_SEED, _P_WORD_LABEL_INLINE,
+            lambda m: f'{m.group(1)} ${m.group(3)}$',
+        )
 
     # Pattern E: fix double subscripts }_{X}}_{Y} → }_{X}}{}_{Y}
-    content = _P_DOUBLE_SUBSCRIPT.sub(r'\1}{}\2', content)
+    if '}_{' in content:
+        content = _P_DOUBLE_SUBSCRIPT.sub(r'\1}{}\2', content)
 
     # Pattern F: strip Word underline spans [text]{.underline} → text
-    content = _P_UNDERLINE_SPAN.sub(r'\1', content)
+    if '{.underline}' in content:
+        content = _P_UNDERLINE_SPAN.sub(r'\1', content)
 
     # Pattern G: sanitize image alt text (display math, unbalanced braces)
-    content = _sanitize_image_alt(content)
+    if '![' in content:
+        content = _sanitize_image_alt(content)
+
+    # The remaining patterns all need a $ (G may have introduced one)
+    if '$' not in content:
+        return content
 
     # Pattern H: merge $X$^Y^ → $X^{Y}$ (pandoc superscript after inline math)
-    content = _P_MATH_THEN_SUPER.sub(r'$\1^{\2}$', content)
+    if '$^' in content:
+        content = _P_MATH_THEN_SUPER.sub(r'$\1^{\2}$', content)
 
     # Pattern J: word$Word$ duplicate text label → word (remove math duplicate)
     content = _P_WORD_TEXT_LABEL.sub(
@@ -371,6 +462,34 @@ def _strip_triple_dollar(content: str) -> str:
     return content
 
 
+def _sub_seeded_lines(content: str, seed: re.Pattern, pattern: Any, repl: Any) -> str:
+    """
+    Apply pattern.sub(repl, ...) to the lines where seed matches.
+
+    pattern may be a re or regex pattern.  For patterns whose matches never
+    span lines and always contain a seed match, this gives the same result
+    as pattern.sub(repl, content), but only the (usually few) seeded lines
+    are scanned by the pattern; the rest of the document is copied in slices.
+    """
+    pieces = []
+    keep_from = 0
+    for m in seed.finditer(content):
+        start = content.rfind('\n', 0, m.start()) + 1
+        if start < keep_from:
+            continue  # another seed on a line already handled
+        end = content.find('\n', m.end())
+        if end == -1:
+            end = len(content)
+        pieces.append(content[keep_from:start])
+        pieces.append(pattern.sub(repl, content[start:end]))
+        keep_from = end
+
+    if not pieces:
+        return content
+    pieces.append(content[keep_from:])
+    return ''.join(pieces)
+
+
 def _sanitize_image_alt(content: str) -> str:
     """
     Fix LaTeX-breaking patterns inside image alt text (which becomes \\caption{}).
@@ -386,34 +505,25 @@ def _sanitize_image_alt(content: str) -> str:
         alt = _P_AI_IMAGE_DESC.sub('', alt)
 
         # Convert \[...\] and \(...\) to $...$ first
-        alt = re.sub(r'\\\[', '$', alt)
-        alt = re.sub(r'\\\]', '$', alt)
-        alt = re.sub(r'\\\(', '$', alt)
-        alt = re.sub(r'\\\)', '$', alt)
+        alt = (
+            alt.replace('\\[', '$').replace('\\]', '$')
+            .replace('\\(', '$').replace('\\)', '$')
+        )
         # Convert $$ → $ (display math illegal in captions)
         alt = alt.replace('$$', '$')
 
         # Check brace balance in each math span; strip broken ones
-        result = []
-        i = 0
-        while i < len(alt):
-            if alt[i] == '$' and (i == 0 or alt[i - 1] != '\\'):
-                # Find closing $
-                j = alt.find('$', i + 1)
-                if j == -1:
-                    # No closing $ — strip from here to end
-                    break
-                span = alt[i + 1:j]
-                if span.count('{') == span.count('}'):
-                    result.append(f'${span}$')
-                # else: skip this broken math span
-                i = j + 1
-            else:
-                result.append(alt[i])
-                i += 1
-
-        alt_fixed = ''.join(result)
-        return f'![{alt_fixed}]({path})'
+        if '$' in alt:
+            alt = _ALT_MATH_SPAN.sub(_keep_balanced, alt)
+        return f'![{alt}]({path})'
+
+    def _keep_balanced(m: re.Match) -> str:
+        span = m.group(1)
+        if span is None:
+            return ''  # no closing $ — strip from here to end
+        if span.count('{') == span.count('}'):
+            return m.group(0)
+        return ''  # skip this broken math span
 
     return _P_IMAGE_LINE.sub(_fix_alt, content)
 
@@ -421,7 +531,7 @@ def _sanitize_image_alt(content: str) -> str:
 # Bare LaTeX command followed by pandoc superscript: \theta^n^ → $\theta^{n}$
 # Pandoc superscripts are short (1-20 chars), never cross newlines, and never
 # contain braces {} (which would indicate LaTeX ^{...} syntax, not pandoc).
-_P_BARE_CMD_SUPER = re.compile(
+_P_BARE_CMD_SUPER = regex.compile(
     r'(?<!\$)'                # not already inside math (no preceding $)
     r'(\\[a-zA-Z]+)'         # group 1: LaTeX command like \theta
     r'\^([^^\n{}'r']{1,20})\^'  # group 2: pandoc superscript (no braces/^/newline)
@@ -443,23 +553,33 @@ def final_sanitize(content: str) -> str:
     # with brace-exclusion in the regexes.
     # content = _strip_dollars_in_display_math(content)
 
+    # Each pass reads the previous one's output, so they stay sequential; the
+    # substring checks skip the ones that cannot match.
+
     # Pattern E: double subscripts (re-run in case fix_delimiters created new ones)
-    content = _P_DOUBLE_SUBSCRIPT.sub(r'\1}{}\2', content)
+    if '}_{' in content:
+        content = _P_DOUBLE_SUBSCRIPT.sub(r'\1}{}\2', content)
 
     # Pattern F: underline spans
-    content = _P_UNDERLINE_SPAN.sub(r'\1', content)
+    if '{.underline}' in content:
+        content = _P_UNDERLINE_SPAN.sub(r'\1', content)
 
     # Pattern G: sanitize image alt text (display math, unbalanced braces)
-    content = _sanitize_image_alt(content)
+    if '![' in content:
+        content = _sanitize_image_alt(content)
 
-    # Pattern H: merge $X$^Y^ → $X^{Y}$ (pandoc superscript after inline math)
-    content = _P_MATH_THEN_SUPER.sub(r'$\1^{\2}$', content)
+    if '^' in content:
+        # Pattern H: merge $X$^Y^ → $X^{Y}$ (pandoc superscript after inline math)
+        if '$^' in content:
+            content = _P_MATH_THEN_SUPER.sub(r'$\1^{\2}$', content)
 
-    # Bare LaTeX command + pandoc superscript: \theta^n^ → $\theta^{n}$
-    content = _P_BARE_CMD_SUPER.sub(r'$\1^{\2}$', content)
+        # Bare LaTeX command + pandoc superscript: \theta^n^ → $\theta^{n}$
+        if '\\' in content:
+            content = _P_BARE_CMD_SUPER.sub(r'$\1^{\2}$', content)
 
     # Pattern K: $ n$ → $n$ (fix space after opening $ — final safety net)
-    content = _P_SPACE_AFTER_OPEN_DOLLAR.sub(r'$\1', content)
+    if '$ ' in content:
+        content = _P_SPACE_AFTER_OPEN_DOLLAR.sub(r'$\1', content)
 
     return content
 
@@ -483,4 +603,4 @@ def _strip_dollars_in_display_math(content: str) -> str:
 
     # Match display math: $$ followed by content, then $$
     # Use non-greedy to avoid spanning multiple display blocks
-    return re.sub(r'\$\$(.*?)\$\$', _clean_block, content, flags=re.DOTALL)
+    return _DISPLAY_MATH_BLOCK.sub(_clean_block, content)
@@ -11,9 +11,9 @@ All fixes are applied only inside math delimiters ($...$ and $$...$$).
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
-from docx2md.processors.base import BaseProcessor
+from docx2md.processors.base import BaseProcessor, PipelineContext
 from docx2md.utils.logging_utils import get_logger
-from docx2md.utils.math_utils import tokenize_math_spans
+from docx2md.utils.math_utils import reassemble
 
 logger = get_logger(__name__)
 
@@ -31,17 +31,25 @@ class EquationFixProcessor(BaseProcessor):
         cfg = (config or {}).get('equation_fix', {})
         self.enabled = cfg.get('enabled', True)
 
+    @classmethod
+    def is_noop(cls, config: Optional[Dict[str, Any]] = None) -> bool:
+        return not (config or {}).get('equation_fix', {}).get('enabled', True)
+
     def process(self, content: str) -> str:
+        return self.process_context(PipelineContext(content)).content
+
+    def process_context(self, ctx: PipelineContext) -> PipelineContext:
         if not self.enabled:
-            return content
+            return ctx
 
-        tokens = tokenize_math_spans(content)
-        result = []
-        for kind, text in tokens:
-            if kind == 'math':
-                text = _fix_equation(text)
-            result.append(text)
-        return ''.join(result)
+        # The fixes never add, remove or isolate a $, so the fixed tokens are
+        # exactly the tokenization of the new content
+        ctx.tokens = [
+            (kind, _fix_equation(text) if kind == 'math' else text)
+            for kind, text in ctx.math_tokens()
+        ]
+        ctx.content = reassemble(ctx.tokens)
+        return ctx
 
 
 # ---------------------------------------------------------------------------
@@ -66,40 +74,54 @@ _P2 = re.compile(
 # Must run AFTER P1 and P2 to avoid stripping needed patterns
 _P3 = re.compile(r'(\\[a-zA-Z]+(?:_\{[^}]*\})?)\^\{\}')
 
-# Pattern 4: \hslash  →  \hbar  (not in all distributions)
-_P4 = re.compile(r'\\hslash')
+# Pattern 4: \hslash  →  \hbar  (not in all distributions) – a plain
+# str.replace in _fix_equation, no regex needed
 
 # Pattern 5: \mathbb{c} and other lowercase blackboard bold (undefined in msbm)
 # Map to \mathbf{c} as a reasonable fallback
 _P5 = re.compile(r'\\mathbb\{([a-z])\}')
 
 
-def _fix_equation(eq: str) -> str:
-    """Apply all equation fixes to a single math token (including delimiters)."""
+def _p1_replace(m: re.Match) -> str:
+    """Replacement for _P1: fold the split-out index into the subscript."""
+    sub = m.group(1).replace(' ', '')
+    sup = m.group(2)
+    return f'\\sum_{{{sub}}}^{{{sup}}}'
 
-    # P1: \sum_{}^{}i = 1^{n} → \sum_{i=1}^{n}
-    def _p1_replace(m: re.Match) -> str:
-        sub = m.group(1).replace(' ', '')
-        sup = m.group(2)
-        return f'\\sum_{{{sub}}}^{{{sup}}}'
 
-    eq = _P1.sub(_p1_replace, eq)
+def _p2_replace(m: re.Match) -> str:
+    """Replacement for _P2: wrap the word subscript in \\text{}."""
+    op = m.group(1)
+    word = m.group(2)
+    return f'\\{op}_{{\\text{{{word}}}}}'
+
+
+def _fix_equation(eq: str) -> str:
+    """Apply all equation fixes to a single math token (including delimiters)."""
+    # Every pattern starts with a LaTeX command; most tokens are plain
+    # variables like $x$ and need no regex work at all
+    if '\\' not in eq:
+        return eq
 
-    # P2: \sum_{row}^{} → \sum_{\text{row}}
-    def _p2_replace(m: re.Match) -> str:
-        op = m.group(1)
-        word = m.group(2)
-        return f'\\{op}_{{\\text{{{word}}}}}'
+    # P1–P3 all need a literal empty superscript
+    if '^{}' in eq:
+        # P1: \sum_{}^{}i = 1^{n} → \sum_{i=1}^{n}
+        if '\\sum_{}^{}' in eq:
+            eq = _P1.sub(_p1_replace, eq)
 
-    eq = _P2.sub(_p2_replace, eq)
+        # P2: \sum_{row}^{} → \sum_{\text{row}}
+        eq = _P2.sub(_p2_replace, eq)
 
-    # P3: remove remaining empty superscripts ^{}
-    eq = _P3.sub(r'\1', eq)
+        # P3: remove remaining empty superscripts ^{} (P1 may have used
+        # up the only one)
+        if '^{}' in eq:
+            eq = _P3.sub(r'\1', eq)
 
     # P4: \hslash → \hbar
-    eq = _P4.sub(r'\\hbar', eq)
+    eq = eq.replace('\\hslash', '\\hbar')
 
     # P5: \mathbb{c} → \mathbf{c} (lowercase blackboard bold is undefined)
-    eq = _P5.sub(r'\\mathbf{\1}', eq)
+    if '\\mathbb{' in eq:
+        eq = _P5.sub(r'\\mathbf{\1}', eq)
 
     return eq
@@ -15,6 +15,22 @@ from docx2md.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Any single \( \) \[ or \] delimiter, and the opener+closer pairs that may
+# follow each other when every equation is a simple, non-nested one
+_DELIM_TOKEN_RE = re.compile(r'\\[()\[\]]')
+_DELIM_PAIRS = frozenset(('\\(\\)', '\\[\\]'))
+
+# \(...\) and \[...\], for the sequential inline-then-display sweeps
+_INLINE_TEX_RE = re.compile(r'\\\((.*?)\\\)', re.DOTALL)
+_DISPLAY_TEX_RE = re.compile(r'\\\[(.*?)\\\]', re.DOTALL)
+
+# $...$ and $$...$$ equations, as counted by validate_equations
+_INLINE_DOLLAR_RE = re.compile(r'\$(.*?)\$', re.DOTALL)
+_DISPLAY_DOLLAR_RE = re.compile(r'\$\$(.*?)\$\$', re.DOTALL)
+
+# \begin{name} or \end{name}, in one scan
+_BEGIN_END_RE = re.compile(r'\\(begin|end)\{([^}]+)\}')
+
 
 class EquationProcessor(BaseProcessor):
     """
@@ -45,6 +61,18 @@ class EquationProcessor(BaseProcessor):
         Returns:
             Processed content with standardized equation delimiters
         """
+        # Every equation to convert starts with \( or \[; a single-character
+        # probe stays cheap on math-heavy text full of other backslashes
+        if '\\' not in content:
+            return content
+        
+        # With the default delimiters and only simple equations, every
+        # delimiter is replaced and plain string replacement is enough
+        if self.inline_delimiters == ("$", "$") and self.display_delimiters == ("$$", "$$"):
+            swapped = _swap_paired_delimiters(content)
+            if swapped is not None:
+                return swapped[0]
+        
         # Fix inline equations
         content = self._fix_inline_equations(content)
         
@@ -64,9 +92,8 @@ class EquationProcessor(BaseProcessor):
             Content with standardized inline equation delimiters
         """
         # Replace \(...\) with inline delimiters
-        pattern = r'\\\((.*?)\\\)'
         replacement = f'{self.inline_delimiters[0]}\\1{self.inline_delimiters[1]}'
-        content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+        content = _INLINE_TEX_RE.sub(replacement, content)
         
         return content
     
@@ -81,9 +108,8 @@ class EquationProcessor(BaseProcessor):
             Content with standardized display equation delimiters
         """
         # Replace \[...\] with display delimiters
-        pattern = r'\\\[(.*?)\\\]'
         replacement = f'{self.display_delimiters[0]}\\1{self.display_delimiters[1]}'
-        content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+        content = _DISPLAY_TEX_RE.sub(replacement, content)
         
         return content
 
@@ -113,31 +139,57 @@ def fix_delimiters(
     if content is None:
         raise ValueError(f"Failed to read input file: {input_file}")
     
-    # Count original occurrences
-    inline_original_count = len(re.findall(r'\\\((.*?)\\\)', content, re.DOTALL))
-    display_original_count = len(re.findall(r'\\\[(.*?)\\\]', content, re.DOTALL))
-    
-    # Fix inline equations
-    pattern_inline = r'\\\((.*?)\\\)'
-    replacement_inline = f'{inline_delimiters[0]}\\1{inline_delimiters[1]}'
-    content = re.sub(pattern_inline, replacement_inline, content, flags=re.DOTALL)
-    
-    # Fix display equations
-    pattern_display = r'\\\[(.*?)\\\]'
-    replacement_display = f'{display_delimiters[0]}\\1{display_delimiters[1]}'
-    content = re.sub(pattern_display, replacement_display, content, flags=re.DOTALL)
-    
-    # Count fixed occurrences
-    inline_fixed_count = len(re.findall(re.escape(inline_delimiters[0]) + r'(.*?)' + re.escape(inline_delimiters[1]), content, re.DOTALL))
-    display_fixed_count = len(re.findall(re.escape(display_delimiters[0]) + r'(.*?)' + re.escape(display_delimiters[1]), content, re.DOTALL))
+    content, stats = fix_delimiters_str(
+        content,
+        inline_delimiters=inline_delimiters,
+        display_delimiters=display_delimiters,
+    )
     
     # Write the output file
     if not write_file(output_file, content):
         raise ValueError(f"Failed to write output file: {output_file}")
     
+    return stats
+
+
+def fix_delimiters_str(
+    content: str,
+    inline_delimiters: Tuple[str, str] = ("$", "$"),
+    display_delimiters: Tuple[str, str] = ("$$", "$$"),
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Fix LaTeX equation delimiters in Markdown content.
+    
+    Args:
+        content: Markdown content
+        inline_delimiters: Tuple of (start, end) delimiters for inline equations
+        display_delimiters: Tuple of (start, end) delimiters for display equations
+        
+    Returns:
+        Tuple of (fixed content, dictionary with statistics about the fixes)
+    """
+    inline_start, inline_end = inline_delimiters
+    display_start, display_end = display_delimiters
+    
+    swapped = None
+    if '\\' not in content:
+        # No \( or \[, so no equation to convert
+        swapped = content, {"inl": 0, "dsp": 0}
+    elif inline_delimiters == ("$", "$") and display_delimiters == ("$$", "$$"):
+        swapped = _swap_paired_delimiters(content)
+    
+    if swapped is not None:
+        content, counts = swapped
+    else:
+        content, counts = _convert_delimiters(
+            content, inline_start, inline_end, display_start, display_end,
+        )
+    inline_original_count = inline_fixed_count = counts["inl"]
+    display_original_count = display_fixed_count = counts["dsp"]
+    
     logger.info(f"Fixed {inline_original_count} inline and {display_original_count} display equations")
     
-    return {
+    return content, {
         "inline_original": inline_original_count,
         "display_original": display_original_count,
         "inline_fixed": inline_fixed_count,
@@ -145,6 +197,71 @@ def fix_delimiters(
     }
 
 
+def _convert_delimiters(
+    content: str,
+    inline_start: str,
+    inline_end: str,
+    display_start: str,
+    display_end: str,
+) -> Tuple[str, Dict[str, int]]:
+    """
+    Convert \\(...\\) and \\[...\\] equations to the given delimiters.
+    
+    Args:
+        content: Markdown content
+        inline_start: Opening delimiter for inline equations
+        inline_end: Closing delimiter for inline equations
+        display_start: Opening delimiter for display equations
+        display_end: Closing delimiter for display equations
+        
+    Returns:
+        Tuple of (converted content, {"inl": count, "dsp": count})
+    """
+    # Inline first, then display over the result, so crossed pairs such as
+    # \(a \[b\) c\] come out as the two sweeps always produced them.  The
+    # replacements are built in callbacks so that delimiters containing
+    # backslashes are not read as re.sub template escapes.
+    content, inline_count = _INLINE_TEX_RE.subn(
+        lambda m: f"{inline_start}{m.group(1)}{inline_end}", content,
+    )
+    content, display_count = _DISPLAY_TEX_RE.subn(
+        lambda m: f"{display_start}{m.group(1)}{display_end}", content,
+    )
+    
+    return content, {"inl": inline_count, "dsp": display_count}
+
+
+def _swap_paired_delimiters(content: str) -> Optional[Tuple[str, Dict[str, int]]]:
+    """
+    Convert to $...$ and $$...$$ with str.replace when that is safe.
+    
+    That is the case when the delimiters in the content come as opener and
+    matching closer, one pair after the other, so the regex would replace
+    every one of them.
+    
+    Args:
+        content: Markdown content
+        
+    Returns:
+        Tuple of (converted content, {"inl": count, "dsp": count}), or None
+        if the content has nested or unpaired delimiters
+    """
+    tokens = _DELIM_TOKEN_RE.findall(content)
+    if len(tokens) % 2:
+        return None
+    if not all(map(_DELIM_PAIRS.__contains__, map(str.__add__, tokens[0::2], tokens[1::2]))):
+        return None
+    
+    inline_count = tokens.count('\\(')
+    display_count = len(tokens) // 2 - inline_count
+    if inline_count:
+        content = content.replace('\\(', '$').replace('\\)', '$')
+    if display_count:
+        content = content.replace('\\[', '$$').replace('\\]', '$$')
+    
+    return content, {"inl": inline_count, "dsp": display_count}
+
+
 def process_equations(
     input_file: Union[str, Path],
     output_file: Union[str, Path],
@@ -186,38 +303,34 @@ def validate_equations(
     if content is None:
         raise ValueError(f"Failed to read input file: {input_file}")
     
-    # Find all inline equations
-    inline_pattern = r'\$(.*?)\$'
-    inline_equations = re.findall(inline_pattern, content, re.DOTALL)
-    
-    # Find all display equations
-    display_pattern = r'\$\$(.*?)\$\$'
-    display_equations = re.findall(display_pattern, content, re.DOTALL)
-    
-    # Validate equations
+    # Validate equations one match at a time; only the issues are kept
     issues = []
     invalid_count = 0
+    inline_count = 0
+    display_count = 0
     
     # Check for basic syntax errors in inline equations
-    for i, eq in enumerate(inline_equations):
+    for inline_count, m in enumerate(_INLINE_DOLLAR_RE.finditer(content), 1):
+        eq = m.group(1)
         if not _is_valid_equation(eq, strict):
             invalid_count += 1
-            issues.append(f"Invalid inline equation #{i+1}: {eq[:30]}...")
+            issues.append(f"Invalid inline equation #{inline_count}: {eq[:30]}...")
     
     # Check for basic syntax errors in display equations
-    for i, eq in enumerate(display_equations):
+    for display_count, m in enumerate(_DISPLAY_DOLLAR_RE.finditer(content), 1):
+        eq = m.group(1)
         if not _is_valid_equation(eq, strict):
             invalid_count += 1
-            issues.append(f"Invalid display equation #{i+1}: {eq[:30]}...")
+            issues.append(f"Invalid display equation #{display_count}: {eq[:30]}...")
     
     is_valid = invalid_count == 0
     
-    logger.info(f"Validation complete: {len(inline_equations)} inline, {len(display_equations)} display, {invalid_count} invalid")
+    logger.info(f"Validation complete: {inline_count} inline, {display_count} display, {invalid_count} invalid")
     
     return {
         "is_valid": is_valid,
-        "inline_count": len(inline_equations),
-        "display_count": len(display_equations),
+        "inline_count": inline_count,
+        "display_count": display_count,
         "invalid_count": invalid_count,
         "issues": issues,
     }
@@ -241,19 +354,23 @@ def _is_valid_equation(equation: str, strict: bool = False) -> bool:
     if open_braces != close_braces:
         return False
     
-    # Check for unbalanced environments
-    begins = re.findall(r'\\begin\{([^}]+)\}', equation)
-    ends = re.findall(r'\\end\{([^}]+)\}', equation)
+    # Check for unbalanced environments.  In strict mode every \end must
+    # also close the innermost open environment of the same name.
+    open_envs: List[str] = []
+    unclosed = 0
+    for kind, name in _BEGIN_END_RE.findall(equation):
+        if kind == 'begin':
+            unclosed += 1
+            if strict:
+                open_envs.append(name)
+        else:
+            unclosed -= 1
+            if strict and (not open_envs or open_envs.pop() != name):
+                return False
     
-    if len(begins) != len(ends):
+    if unclosed:
         return False
     
-    # In strict mode, check that environment names match
-    if strict and begins:
-        for b, e in zip(begins, ends):
-            if b != e:
-                return False
-    
     # Additional checks could be added here
     
     return True
\ No newline at end of file
@@ -11,11 +11,13 @@ This processor:
   3. Removes the now-redundant caption paragraph
 """
 
+import itertools
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from docx2md.processors.base import BaseProcessor
 from docx2md.utils.logging_utils import get_logger
+from docx2md.utils.math_utils import tokenize_math_spans
 
 logger = get_logger(__name__)
 
@@ -25,17 +27,38 @@ logger = get_logger(__name__)
 #   *Figure* *1.*   →  split italic (Word sometimes splits number/label)
 #   ***Figure* *4.*-**  →  mixed asterisks
 # Strategy: look for "Figure" anywhere near the start (within first 30 chars)
+# Used with match() at the caption's first character, so no ^ anchor.
 _CAPTION_START = re.compile(
-    r'^\*{1,3}Figure',
+    r'\*{1,3}Figure',
     re.IGNORECASE,
 )
 
-# Matches an image reference: ![...](path)  (possibly multi-line alt text)
-_IMAGE_START = re.compile(r'^!\[')
+# Matches the start of an image paragraph: ![...](path)  (possibly multi-line
+# alt text) as the first non-blank text after a blank line.  Group 1 is the
+# paragraph's leading whitespace, which may not contain a blank line itself
+# (the paragraph would then start after it).  The lookahead lets the scan
+# skip ordinary paragraph breaks quickly.
+_IMAGE_BLOCK = re.compile(r'\n\n(?=[\s!])\n*((?:\n?[^\S\n])*\n?)!\[')
+
+# The same for an image as the very first paragraph (used with match())
+_LEADING_IMAGE_BLOCK = re.compile(r'((?:\n?[^\S\n])*\n?)!\[')
 
 # Strips emphasis markers and collapses whitespace from caption text
 _EMPHASIS = re.compile(r'\*{1,3}(.*?)\*{1,3}', re.DOTALL)
 _NEWLINE_SPACE = re.compile(r'\s*\n\s*')
+_MULTI_SPACE = re.compile(r'  +')
+
+# Unescaped $...$ span in a caption, or a lone $ running to the end
+_CAPTION_MATH_SPAN = re.compile(r'(?<!\\)\$(?:([^$]*)\$|[^$]*\Z)')
+
+# Paragraph separator of more than one blank line (collapsed to one)
+_EXTRA_BLANK_LINES = re.compile(r'\n{3,}')
+
+# First non-whitespace character (start of the next non-empty paragraph)
+_NON_SPACE = re.compile(r'\S')
+
+# The ![...] part of an image reference, up to the ( of the path
+_IMAGE_ALT = re.compile(r'!\[[\s\S]*?\](?=\()')
 
 
 class FigureProcessor(BaseProcessor):
@@ -51,43 +74,65 @@ class FigureProcessor(BaseProcessor):
         cfg = (config or {}).get('figures', {})
         self.enabled = cfg.get('enabled', True)
 
+    @classmethod
+    def is_noop(cls, config: Optional[Dict[str, Any]] = None) -> bool:
+        return not (config or {}).get('figures', {}).get('enabled', True)
+
     def process(self, content: str) -> str:
         if not self.enabled:
             return content
 
-        # Split on blank lines to get paragraph blocks
-        blocks = re.split(r'\n{2,}', content)
+        # Paragraphs are separated by blank lines.  Only an image paragraph
+        # followed by a caption paragraph is rewritten; the text in between
+        # is copied over with its paragraph separators normalized.
         result: List[str] = []
-        i = 0
-
-        while i < len(blocks):
-            block = blocks[i].strip()
-
-            if _IMAGE_START.match(block):
-                # Look ahead for the next non-empty block
-                j = i + 1
-                while j < len(blocks) and not blocks[j].strip():
-                    j += 1
-
-                if j < len(blocks):
-                    next_block = blocks[j].strip()
-                    cap_match = _CAPTION_START.match(next_block)
-
-                    if cap_match:
-                        # Extract and clean the real caption text
-                        caption_text = _extract_caption(next_block)
-                        # Replace AI alt-text in the image block with the real caption
-                        new_block = _replace_alt_text(block, caption_text)
-                        result.append(new_block)
-                        # Skip over any blank blocks and the caption paragraph
-                        i = j + 1
-                        logger.debug(f'Replaced figure caption: {caption_text[:60]}...')
-                        continue
-
-            result.append(blocks[i])
-            i += 1
-
-        return '\n\n'.join(result)
+        done = 0
+
+        matches: Iterable[re.Match] = _IMAGE_BLOCK.finditer(content)
+        first = _LEADING_IMAGE_BLOCK.match(content)
+        if first:
+            matches = itertools.chain((first,), matches)
+
+        for m in matches:
+            image_start = m.end() - 2
+            image_end = content.find('\n\n', image_start)
+            if image_end == -1:
+                continue
+
+            # Look ahead for the next non-empty block
+            next_char = _NON_SPACE.search(content, image_end)
+            if next_char is None:
+                continue
+
+            # Captions start with emphasis; the regex is only needed for the
+            # case-insensitive "Figure" after it
+            caption_start = next_char.start()
+            if next_char.group() != '*' or not _CAPTION_START.match(content, caption_start):
+                continue
+
+            caption_end = content.find('\n\n', caption_start)
+            if caption_end == -1:
+                caption_end = len(content)
+
+            # Extract and clean the real caption text
+            caption_text = _extract_caption(content[caption_start:caption_end].rstrip())
+            # Replace AI alt-text in the image block with the real caption
+            new_block = _replace_alt_text(content[image_start:image_end].rstrip(), caption_text)
+            result.append(_collapse_blank_lines(content[done:m.start(1)]))
+            result.append(new_block)
+            # Skip over any blank blocks and the caption paragraph
+            done = caption_end
+            logger.debug(f'Replaced figure caption: {caption_text[:60]}...')
+
+        result.append(_collapse_blank_lines(content[done:]))
+        return ''.join(result)
+
+
+def _collapse_blank_lines(text: str) -> str:
+    """Collapse runs of blank lines between paragraphs to a single one."""
+    if '\n\n\n' not in text:
+        return text
+    return _EXTRA_BLANK_LINES.sub('\n\n', text)
 
 
 def _extract_caption(caption_block: str) -> str:
@@ -125,49 +170,48 @@ def _sanitize_caption_math(text: str) -> str:
     - Inline math: $ or \\(...\\) → keep as $
     - Strip any math span with unbalanced braces (garbled Word output)
     """
-    # Convert \[...\] display math to $...$ inline (display illegal in captions)
-    text = re.sub(r'\\\[', '$', text)
-    text = re.sub(r'\\\]', '$', text)
-    # Convert \(...\) to $...$ for uniformity
-    text = re.sub(r'\\\(', '$', text)
-    text = re.sub(r'\\\)', '$', text)
+    # All four TeX delimiters start with a backslash; most captions have none
+    if '\\' in text:
+        # Convert \[...\] display math to $...$ inline (display illegal in captions)
+        text = text.replace('\\[', '$').replace('\\]', '$')
+        # Convert \(...\) to $...$ for uniformity
+        text = text.replace('\\(', '$').replace('\\)', '$')
     # Convert remaining $$ → $ (display math cannot appear inside \caption{})
     text = text.replace('$$', '$')
 
-    # Walk through math spans and drop any with unbalanced braces
-    result = []
-    i = 0
-    while i < len(text):
-        if text[i] == '$' and (i == 0 or text[i - 1] != '\\'):
-            j = text.find('$', i + 1)
-            if j == -1:
-                break  # no closing $ — drop remainder
-            span = text[i + 1:j]
-            if span.count('{') == span.count('}'):
-                result.append(f'${span}$')
-            # else: skip broken math span
-            i = j + 1
-        else:
-            result.append(text[i])
-            i += 1
+    # Drop any math span with unbalanced braces
+    if '$' not in text:
+        return text
+    return _CAPTION_MATH_SPAN.sub(_keep_balanced_math, text)
 
-    return ''.join(result)
+
+def _keep_balanced_math(m: re.Match) -> str:
+    """Replacement for _CAPTION_MATH_SPAN: keep the span only if its braces balance."""
+    span = m.group(1)
+    if span is None:
+        return ''  # no closing $ — drop remainder
+    if span.count('{') == span.count('}'):
+        return m.group(0)
+    return ''  # skip broken math span
 
 
 def _strip_emphasis_outside_math(text: str) -> str:
     """
     Remove *...* and ***...*** markers from text, leaving $math$ spans intact.
     """
+    # Without a $ the whole caption is a single text token
+    if '$' not in text:
+        return _MULTI_SPACE.sub(' ', _EMPHASIS.sub(r'\1', text))
+
     # Tokenize math vs text
-    from docx2md.utils.math_utils import tokenize_math_spans
     tokens = tokenize_math_spans(text)
     result = []
     for kind, part in tokens:
         if kind == 'text':
             # Remove emphasis markers
-            part = re.sub(r'\*{1,3}(.*?)\*{1,3}', r'\1', part, flags=re.DOTALL)
+            part = _EMPHASIS.sub(r'\1', part)
             # Clean up double spaces
-            part = re.sub(r'  +', ' ', part)
+            part = _MULTI_SPACE.sub(' ', part)
         result.append(part)
     return ''.join(result)
 
@@ -181,8 +225,7 @@ def _replace_alt_text(image_block: str, new_alt: str) -> str:
     # Pattern matches ![...multi...line...](path)
     # We replace the [...] part (everything between ![ and ](
     replacement = f'![{new_alt}]'
-    result = re.sub(
-        r'!\[[\s\S]*?\](?=\()',  # match ![ ... ] (non-greedy, up to the ()
+    result = _IMAGE_ALT.sub(
         lambda _: replacement,   # lambda avoids re treating \cmd as backrefs
         image_block,
     )
@@ -19,6 +19,8 @@ import re
 import unicodedata
 from typing import Any, Dict, List, Optional, Tuple
 
+import regex
+
 from docx2md.processors.base import BaseProcessor
 from docx2md.utils.logging_utils import get_logger
 
@@ -45,6 +47,13 @@ _IMAGE_REF = re.compile(r'!\[.*?\]\(.*?\)')
 # YAML front matter block at the start of the document
 _YAML_BLOCK = re.compile(r'\A---\n.*?\n---\n', re.DOTALL)
 
+# title: / author: lines inside the YAML block, with optional quotes
+_YAML_TITLE = re.compile(r'^title:\s*"?([^"\n]+)"?\s*$', re.MULTILINE)
+_YAML_AUTHOR = re.compile(r'^author:\s*"?([^"\n]+)"?\s*$', re.MULTILINE)
+
+# A line that is entirely bold: **text** (title fallback)
+_BOLD_LINE = re.compile(r'^\*\*([^*\n]+)\*\*\s*$', re.MULTILINE)
+
 # First real heading (# at level 1 or 2)
 _FIRST_HEADING = re.compile(r'^#{1,2}\s+', re.MULTILINE)
 
@@ -54,18 +63,28 @@ _VOLUME_PART_LINE = re.compile(
     re.IGNORECASE,
 )
 
+# The word every anchor line contains.  Case-insensitive literal search is
+# several times faster in the regex module; for these six letters both
+# engines fold case the same way.
+_VOLUME_WORD = regex.compile(r'volume', regex.IGNORECASE)
+
 
 class FrontMatterStructureProcessor(BaseProcessor):
     """Detect and structure body front matter from converted .docx files."""
 
     def process(self, content: str, doc_properties: Optional[Dict[str, Any]] = None) -> str:
-        pre, heading_start = self._split_pre_heading(content)
+        yaml_match = _YAML_BLOCK.match(content)
+        pre, heading_start = self._split_pre_heading(content, yaml_match)
         if not pre.strip():
             return content
 
         # Extract title and author for title-page-repeat detection
         # Priority: doc_properties (from python-docx) > YAML > body scan
-        title, author = self._extract_metadata(content, doc_properties or {})
+        title, author = self._extract_metadata(content, doc_properties or {}, yaml_match)
+
+        # Title and author are matched accent-insensitively against every
+        # section; normalize them once for the document
+        title_norm, author_norms = self._normalize_names(title, author)
 
         sections = _PAGE_BREAK.split(pre)
 
@@ -74,7 +93,7 @@ class FrontMatterStructureProcessor(BaseProcessor):
             text = section.strip()
             if not text:
                 continue
-            kind = self._classify(text, title, author)
+            kind = self._classify(text, title_norm, author_norms)
             classified.append((kind, text))
 
         if not classified:
@@ -102,7 +121,7 @@ class FrontMatterStructureProcessor(BaseProcessor):
             new_pre += '\n\n'
 
         # Reconstruct: everything before pre + new_pre + heading onward
-        result = self._reconstruct(content, new_pre, heading_start)
+        result = self._reconstruct(content, new_pre, heading_start, yaml_match)
 
         # Second pass: strip orphaned title/subtitle fragments in the body
         # (e.g. "Volume I, Part 1:\n\nMathematical Foundations\n\nand the Singularity")
@@ -111,37 +130,41 @@ class FrontMatterStructureProcessor(BaseProcessor):
 
         return result
 
-    def _split_pre_heading(self, content: str) -> Tuple[str, int]:
+    def _split_pre_heading(
+        self, content: str, yaml_match: Optional[re.Match],
+    ) -> Tuple[str, int]:
         """Return (pre-heading text, index of first heading) from body content.
 
-        The "body" starts after the YAML front matter block (if present).
+        The "body" starts after the YAML front matter block (if present,
+        ``yaml_match`` is its ``_YAML_BLOCK`` match).
         """
         body_start = 0
-        yaml_match = _YAML_BLOCK.match(content)
         if yaml_match:
             body_start = yaml_match.end()
 
-        body = content[body_start:]
-        heading_match = _FIRST_HEADING.search(body)
+        # The YAML block ends with a newline, so ^ still matches at body_start
+        heading_match = _FIRST_HEADING.search(content, body_start)
         if heading_match:
-            pre = body[:heading_match.start()]
-            heading_start = body_start + heading_match.start()
+            heading_start = heading_match.start()
         else:
             # No heading found — entire body is pre-heading
-            pre = body
             heading_start = len(content)
+        pre = content[body_start:heading_start]
 
         return pre, heading_start
 
-    def _reconstruct(self, content: str, new_pre: str, heading_start: int) -> str:
+    def _reconstruct(
+        self, content: str, new_pre: str, heading_start: int,
+        yaml_match: Optional[re.Match],
+    ) -> str:
         """Rebuild the document with new pre-heading content."""
-        yaml_match = _YAML_BLOCK.match(content)
         yaml_part = content[:yaml_match.end()] if yaml_match else ''
         heading_part = content[heading_start:]
         return yaml_part + new_pre + heading_part
 
     def _extract_metadata(
         self, content: str, doc_properties: Dict[str, Any],
+        yaml_match: Optional[re.Match],
     ) -> Tuple[str, str]:
         """Extract title and author from available sources.
 
@@ -155,58 +178,74 @@ class FrontMatterStructureProcessor(BaseProcessor):
 
         # Try YAML if doc_properties didn't have them
         if not title or not author:
-            yaml_match = _YAML_BLOCK.match(content)
             if yaml_match:
                 yaml_text = yaml_match.group()
                 if not title:
-                    m = re.search(r'^title:\s*"?([^"\n]+)"?\s*$', yaml_text, re.MULTILINE)
+                    m = _YAML_TITLE.search(yaml_text)
                     if m:
                         title = m.group(1).strip()
                 if not author:
-                    m = re.search(r'^author:\s*"?([^"\n]+)"?\s*$', yaml_text, re.MULTILINE)
+                    m = _YAML_AUTHOR.search(yaml_text)
                     if m:
                         author = m.group(1).strip()
 
         # Fallback: scan body for bold title
         if not title:
-            m = re.search(r'^\*\*([^*\n]+)\*\*\s*$', content[:500], re.MULTILINE)
+            m = _BOLD_LINE.search(content, 0, 500)
             if m:
                 title = m.group(1).strip()
 
         return title, author
 
-    def _classify(self, text: str, title: str, author: str) -> str:
+    def _normalize_names(self, title: str, author: str) -> Tuple[Optional[str], List[str]]:
+        """Return the forms of title and author that _classify looks for.
+
+        Both are lowercased with accents stripped (NFD decomposition).  The
+        title is None when there is none; the author list also holds the
+        "First Last" form when the author is "Last, First", and is empty
+        when there is no author.
+        """
+        title_norm = self._strip_accents(title.lower()) if title else None
+
+        author_norms: List[str] = []
+        if author:
+            author_norms.append(self._strip_accents(author.lower()))
+            # Flipped name: "Glowney, Jason" → "Jason Glowney"
+            if ',' in author:
+                parts = author.split(',', 1)
+                if len(parts) == 2 and parts[1].strip():
+                    flipped = f"{parts[1].strip()} {parts[0].strip()}"
+                    author_norms.append(self._strip_accents(flipped.lower()))
+
+        return title_norm, author_norms
+
+    def _classify(self, text: str, title_norm: Optional[str], author_norms: List[str]) -> str:
         """Classify a front matter section.
 
+        ``title_norm`` and ``author_norms`` come from ``_normalize_names``.
+
         Returns one of: 'copyright', 'dedication', 'title_repeat', 'unknown'.
         """
         # Copyright page: contains copyright keywords
         if _COPYRIGHT_KEYWORDS.search(text):
             return 'copyright'
 
+        text_norm = self._strip_accents(text.lower()) if title_norm is not None else ''
+
         # Title page repeat: contains both the book title and author name
         # Uses accent-insensitive comparison (NFD decomposition strips accents)
         # Also tries "First Last" when author is "Last, First"
-        if title and author:
-            text_norm = self._strip_accents(text.lower())
-            has_title = self._strip_accents(title.lower()) in text_norm
-            author_norm = self._strip_accents(author.lower())
-            has_author = author_norm in text_norm
-            # Try flipped name: "Glowney, Jason" → "Jason Glowney"
-            if not has_author and ',' in author:
-                parts = author.split(',', 1)
-                if len(parts) == 2 and parts[1].strip():
-                    flipped = f"{parts[1].strip()} {parts[0].strip()}"
-                    has_author = self._strip_accents(flipped.lower()) in text_norm
+        if title_norm is not None and author_norms:
+            has_title = title_norm in text_norm
+            has_author = any(name in text_norm for name in author_norms)
             if has_title and has_author:
                 return 'title_repeat'
 
         # Title fragment: contains the title, short, and all lines are
         # formatted (italic/bold) — a subtitle or volume page without author
-        if title:
-            text_norm = self._strip_accents(text.lower())
+        if title_norm is not None:
             lines = [line for line in text.split('\n') if line.strip()]
-            if (self._strip_accents(title.lower()) in text_norm
+            if (title_norm in text_norm
                     and len(lines) <= 5
                     and all(self._is_formatted_or_empty(line) for line in lines)):
                 return 'title_repeat'
@@ -235,6 +274,11 @@ class FrontMatterStructureProcessor(BaseProcessor):
         Anchored on "Volume X, Part Y:" lines, removes the anchor and
         adjacent short subtitle paragraphs.
         """
+        # Almost no document has an anchor; rule that out in one scan
+        # before splitting into lines
+        if not _VOLUME_WORD.search(content):
+            return content
+
         lines = content.split('\n')
 
         # Find "Volume X, Part Y:" anchor lines
@@ -282,10 +326,13 @@ class FrontMatterStructureProcessor(BaseProcessor):
     @staticmethod
     def _strip_accents(s: str) -> str:
         """Remove accent marks for fuzzy title matching."""
-        return ''.join(
+        # ASCII text has nothing to decompose (most section text)
+        if s.isascii():
+            return s
+        return ''.join([
             c for c in unicodedata.normalize('NFD', s)
             if unicodedata.category(c) != 'Mn'
-        )
+        ])
 
     @staticmethod
     def _is_italic_or_empty(line: str) -> bool:
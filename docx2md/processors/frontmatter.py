@@ -26,30 +26,45 @@ from docx2md.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
-# Matches a bold-only first paragraph: **Title text**
-_BOLD_TITLE = re.compile(r'^\*\*([^*\n]+)\*\*\s*$', re.MULTILINE)
-
-# Matches an italic-only paragraph: *Subtitle text*
-_ITALIC_SUBTITLE = re.compile(r'^\*([^*\n]+)\*\s*$', re.MULTILINE)
 
-# Matches "Name -- <email>" or "Name -- email@..." author line
+# Matches "Name -- <email>" or "Name -- email@..." author line. The name
+# ends on a non-space character so a long run of spaces is not rescanned
+# from every position inside it.
 _AUTHOR_LINE = re.compile(
-    r'^([A-Z][^\n<]*?)\s+--\s+<?([a-zA-Z0-9._%+\-]+@[^\s>]+)>?\s*$',
+    r'^([A-Z](?:[^\n<]*?[^\s<])??)\s+--\s+<?([a-zA-Z0-9._%+\-]+@[^\s>]+)>?\s*$',
     re.MULTILINE,
 )
 
+# Line patterns below anchor with a literal + lookbehind, not ^ (see cleanup.py)
+
+# Matches a bold-only first paragraph: **Title text**
+_BOLD_TITLE = re.compile(r'\*(?<![^\n]\*)\*([^*\n]+)\*\*\s*$', re.MULTILINE)
+
+# Matches an italic-only paragraph: *Subtitle text*
+_ITALIC_SUBTITLE = re.compile(r'\*(?<![^\n]\*)([^*\n]+)\*\s*$', re.MULTILINE)
+
 # Title block at start of document: optional bold title + optional italic subtitle +
 # optional author line, each separated by a blank line
 _TITLE_BLOCK = re.compile(
-    r'^\*\*[^*\n]+\*\*\s*\n\n'          # bold title + blank line
+    r'\*(?<![^\n]\*)\*[^*\n]+\*\*\s*\n\n'  # bold title + blank line
     r'(?:\*[^*\n]+\*\s*\n\n)?'           # optional italic subtitle + blank line
-    r'(?:[A-Z][^\n<]*?--[^\n]+\n\n)?',   # optional author line + blank line
+    r'(?:[A-Z](?=[^\n<]*?--[^\n])[^\n]+\n\n)?',  # optional author line + blank line
     re.MULTILINE,
 )
 
 # Headings that should get \newpage before them
 _NEWPAGE_HEADINGS = re.compile(
-    r'^(#{1,2}\s+(?:References|Bibliography|Index|Glossary)\s*)$',
+    r'(#(?<![^\n]#)#?\s+(?:References|Bibliography|Index|Glossary)\s*)$',
+    re.MULTILINE,
+)
+
+# Existing YAML block: '---' after optional leading whitespace (matched in
+# place rather than through content.lstrip(), which copies the document)
+_LEADING_YAML_FENCE = re.compile(r'\s*---')
+
+# Front matter headings already present in the body, found in one pass
+_BODY_FRONTMATTER_HEADING = re.compile(
+    r'#(?<![^\n]#) (Dedication|Copyright Page)\s*$',
     re.MULTILINE,
 )
 
@@ -72,6 +87,70 @@ def _fmt(value: Any) -> str:
     return str(value)
 
 
+def _render_fields(
+    fields: Tuple[Tuple[Optional[str], Any], ...],
+    overrides: Dict[str, Any],
+) -> List[str]:
+    """Render optional fields: active if overridden, else commented with the default."""
+    lines = []
+    for key, default in fields:
+        if key is None:
+            lines.append('#')
+        elif key in overrides:
+            lines.append(f'{key}: {_fmt(overrides[key])}')
+        else:
+            lines.append(f'# {key}: {_fmt(default)}')
+    return lines
+
+
+# mdtexpdf fields that are active by default; the values do not depend on the
+# document (copyright_year, which does, is handled separately)
+_DEFAULT_MDTEXPDF: Dict[str, Any] = {
+    'format': 'book',
+    'no_numbers': True,
+    'toc': True,
+    'header_footer_policy': 'all',
+    'pageof': True,
+    'date_footer': True,
+    'copyright_page': True,
+    'chapters_on_recto': True,
+    'drop_caps': True,
+    'edition': 'First Edition',
+}
+
+# Template sections whose fields all have fixed defaults. They are rendered
+# once here and reused unless an override touches one of their keys.
+# A key of None emits a bare '#' separator line.
+_COVER_FIELDS: Tuple[Tuple[Optional[str], Any], ...] = (
+    ('cover_image', 'img/cover.jpeg'),
+    ('cover_title_color', 'white'),
+    ('cover_title_show', True),
+    ('cover_subtitle_show', True),
+    ('cover_author_position', 'bottom'),
+    ('cover_overlay_opacity', 0.4),
+    ('cover_fit', 'cover'),
+    (None, None),
+    ('back_cover_image', 'img/back.jpeg'),
+    ('back_cover_content', 'quote'),
+    ('back_cover_text', 'Back cover description text.'),
+    ('back_cover_author_bio', True),
+    ('back_cover_author_bio_text', 'Author bio text.'),
+    ('back_cover_isbn_barcode', False),
+    ('back_cover_text_background', True),
+    ('back_cover_text_background_opacity', 0.3),
+    ('back_cover_text_color', 'white'),
+)
+_PRINT_FIELDS: Tuple[Tuple[Optional[str], Any], ...] = (
+    ('trim_size', '6x9'),
+    ('paper_stock', 'cream60'),
+    ('spine_text', 'auto'),
+)
+_COVER_KEYS = frozenset(key for key, _ in _COVER_FIELDS if key)
+_PRINT_KEYS = frozenset(key for key, _ in _PRINT_FIELDS)
+_COVER_LINES = _render_fields(_COVER_FIELDS, {})
+_PRINT_LINES = _render_fields(_PRINT_FIELDS, {})
+
+
 def _flip_author_name(name: str) -> str:
     """Flip 'Last, First' or 'Last, First Middle' to 'First Middle Last'."""
     if ',' in name:
@@ -110,7 +189,7 @@ def generate_yaml_frontmatter(
         return '', content
 
     # Guard: don't double-prepend if content already starts with YAML
-    if content.lstrip().startswith('---'):
+    if _LEADING_YAML_FENCE.match(content):
         logger.debug('Content already has YAML frontmatter, skipping generation')
         return '', content
 
@@ -141,10 +220,12 @@ def generate_yaml_frontmatter(
     overrides = dict(fm_cfg.get('mdtexpdf', {}))
 
     # ---- Detect body front matter headings ----
-    has_body_frontmatter = {
-        'dedication': bool(re.search(r'^# Dedication\s*$', content, re.MULTILINE)),
-        'copyright_page': bool(re.search(r'^# Copyright Page\s*$', content, re.MULTILINE)),
-    }
+    has_body_frontmatter = {'dedication': False, 'copyright_page': False}
+    for m in _BODY_FRONTMATTER_HEADING.finditer(content):
+        key = 'dedication' if m.group(1) == 'Dedication' else 'copyright_page'
+        has_body_frontmatter[key] = True
+        if all(has_body_frontmatter.values()):
+            break
 
     # ---- Build template ----
     now = datetime.now()
@@ -202,23 +283,30 @@ def _build_yaml_template(
 
     lines: List[str] = []
     lines.append('---')
+    append = lines.append
 
     # Helper: emit an active (uncommented) key-value pair
     def active(key: str, value: Any) -> None:
-        lines.append(f'{key}: {_fmt(value)}')
+        append(f'{key}: {_fmt(value)}')
 
     # Helper: emit a commented key-value pair
     def commented(key: str, value: Any) -> None:
-        lines.append(f'# {key}: {_fmt(value)}')
+        append(f'# {key}: {_fmt(value)}')
 
-    # Helper: emit a field — active if in overrides or if force_active, else commented
+    # Helper: emit a field — active if in overrides or if force_active, else commented.
+    # The field helpers append directly rather than through active()/commented():
+    # they run for every field, so the extra call per field adds up.
     def field(key: str, default: Any, force_active: bool = False) -> None:
         if key in overrides:
-            active(key, overrides[key])
+            append(f'{key}: {_fmt(overrides[key])}')
         elif force_active:
-            active(key, default)
+            append(f'{key}: {_fmt(default)}')
         else:
-            commented(key, default)
+            append(f'# {key}: {_fmt(default)}')
+
+    # Helper: emit a _DEFAULT_MDTEXPDF field — always active
+    def default_field(key: str) -> None:
+        append(f'{key}: {_fmt(overrides.get(key, _DEFAULT_MDTEXPDF[key]))}')
 
     # === COMMON METADATA ===
     lines.append('# === COMMON METADATA ===')
@@ -238,17 +326,17 @@ def _build_yaml_template(
 
     # === PDF SETTINGS ===
     lines.append('# === PDF SETTINGS ===')
-    field('format', 'book', force_active=True)
-    field('no_numbers', True, force_active=True)
-    field('toc', True, force_active=True)
+    default_field('format')
+    default_field('no_numbers')
+    default_field('toc')
     field('lof', True)
     field('lot', True)
     field('index', True)
-    field('header_footer_policy', 'all', force_active=True)
+    default_field('header_footer_policy')
     footer_default = f'\u00a9 {copyright_year} {author}. All rights reserved.'
     field('footer', footer_default)
-    field('pageof', True, force_active=True)
-    field('date_footer', True, force_active=True)
+    default_field('pageof')
+    default_field('date_footer')
     lines.append('')
 
     # === PROFESSIONAL BOOK FEATURES ===
@@ -260,7 +348,7 @@ def _build_yaml_template(
         commented('copyright_page', True)
         lines.append('# (detected # Copyright Page heading in body)')
     else:
-        field('copyright_page', True, force_active=True)
+        default_field('copyright_page')
     if has_body_frontmatter.get('dedication'):
         commented('dedication', 'To whom this book is dedicated.')
         lines.append('# (detected # Dedication heading in body)')
@@ -268,12 +356,12 @@ def _build_yaml_template(
         field('dedication', 'To whom this book is dedicated.')
     field('epigraph', 'An inspiring quote.')
     field('epigraph_source', 'Author of the quote')
-    field('chapters_on_recto', True, force_active=True)
-    field('drop_caps', True, force_active=True)
+    default_field('chapters_on_recto')
+    default_field('drop_caps')
     field('equation_numbers', True)
     field('publisher', 'Publisher Name')
     field('copyright_year', copyright_year, force_active=True)
-    field('edition', 'First Edition', force_active=True)
+    default_field('edition')
     field('edition_date', date_str)
     field('printing', f'First Printing, {date_str}')
     field('publisher_address', 'Address')
@@ -282,30 +370,18 @@ def _build_yaml_template(
 
     # === COVER SYSTEM ===
     lines.append('# === COVER SYSTEM ===')
-    field('cover_image', 'img/cover.jpeg')
-    field('cover_title_color', 'white')
-    field('cover_title_show', True)
-    field('cover_subtitle_show', True)
-    field('cover_author_position', 'bottom')
-    field('cover_overlay_opacity', 0.4)
-    field('cover_fit', 'cover')
-    lines.append('#')
-    field('back_cover_image', 'img/back.jpeg')
-    field('back_cover_content', 'quote')
-    field('back_cover_text', 'Back cover description text.')
-    field('back_cover_author_bio', True)
-    field('back_cover_author_bio_text', 'Author bio text.')
-    field('back_cover_isbn_barcode', False)
-    field('back_cover_text_background', True)
-    field('back_cover_text_background_opacity', 0.3)
-    field('back_cover_text_color', 'white')
+    if overrides.keys().isdisjoint(_COVER_KEYS):
+        lines.extend(_COVER_LINES)
+    else:
+        lines.extend(_render_fields(_COVER_FIELDS, overrides))
     lines.append('')
 
     # === PRINT FORMAT ===
     lines.append('# === PRINT FORMAT ===')
-    field('trim_size', '6x9')
-    field('paper_stock', 'cream60')
-    field('spine_text', 'auto')
+    if overrides.keys().isdisjoint(_PRINT_KEYS):
+        lines.extend(_PRINT_LINES)
+    else:
+        lines.extend(_render_fields(_PRINT_FIELDS, overrides))
     lines.append('')
 
     # === ACKNOWLEDGMENTS & ABOUT THE AUTHOR ===
@@ -363,20 +439,20 @@ def _extract_from_body(
     email = ''
 
     # Look for bold title paragraph
-    if not title:
-        m = _BOLD_TITLE.search(content[:500])
+    if not title and content.find('**', 0, 500) != -1:
+        m = _BOLD_TITLE.search(content, 0, 500)
         if m:
             title = m.group(1).strip()
 
     # Look for italic subtitle paragraph
-    if not subtitle:
-        m = _ITALIC_SUBTITLE.search(content[:800])
+    if not subtitle and content.find('*', 0, 800) != -1:
+        m = _ITALIC_SUBTITLE.search(content, 0, 800)
         if m:
             subtitle = m.group(1).strip()
 
     # Look for "Name -- <email>" author line
-    if not author:
-        m = _AUTHOR_LINE.search(content[:1000])
+    if not author and content.find('--', 0, 1000) != -1:
+        m = _AUTHOR_LINE.search(content, 0, 1000)
         if m:
             author = m.group(1).strip()
             email = m.group(2).strip()
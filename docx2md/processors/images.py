@@ -24,6 +24,9 @@ class ImageProcessor(BaseProcessor):
     Processor for images in Markdown.
     """
     
+    # Image references never span lines
+    line_oriented = True
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the image processor.
@@ -145,6 +148,47 @@ def extract_and_process_images(
     if content is None:
         raise ValueError(f"Failed to read input file: {input_file}")
     
+    content, stats = extract_and_process_images_str(
+        content,
+        input_dir=os.path.dirname(os.path.abspath(input_file)),
+        output_dir=os.path.dirname(os.path.abspath(output_file)),
+        images_dir=images_dir,
+        optimize=optimize,
+        max_width=max_width,
+        max_height=max_height,
+    )
+    
+    # Write the output file
+    if not write_file(output_file, content):
+        raise ValueError(f"Failed to write output file: {output_file}")
+    
+    return stats
+
+
+def extract_and_process_images_str(
+    content: str,
+    input_dir: Union[str, Path],
+    output_dir: Union[str, Path],
+    images_dir: str = "./images",
+    optimize: bool = True,
+    max_width: int = 800,
+    max_height: int = 600,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Extract and process images referenced in Markdown content.
+    
+    Args:
+        content: Markdown content
+        input_dir: Directory that relative image paths are resolved against
+        output_dir: Directory of the output file (rewritten paths are relative to it)
+        images_dir: Directory to store processed images
+        optimize: Whether to optimize images
+        max_width: Maximum image width
+        max_height: Maximum image height
+        
+    Returns:
+        Tuple of (processed content, dictionary with statistics about the processing)
+    """
     # Ensure the images directory exists
     os.makedirs(images_dir, exist_ok=True)
     
@@ -168,7 +212,6 @@ def extract_and_process_images(
         full_path = norm_path
         if not os.path.isabs(norm_path):
             # If the path is relative, make it relative to the input file directory
-            input_dir = os.path.dirname(os.path.abspath(input_file))
             full_path = os.path.join(input_dir, norm_path)
         
         # Check if the image exists
@@ -201,9 +244,6 @@ def extract_and_process_images(
                 import shutil
                 shutil.copy2(full_path, new_path)
             
-            # Calculate the relative path from the output file to the image
-            output_dir = os.path.dirname(os.path.abspath(output_file))
-            
             # Get the path relative to the output directory
             rel_new_path = os.path.relpath(new_path, output_dir)
             
@@ -268,13 +308,9 @@ def extract_and_process_images(
         content
     )
     
-    # Write the output file
-    if not write_file(output_file, content):
-        raise ValueError(f"Failed to write output file: {output_file}")
-    
     logger.info(f"Processed {processed_images} images, {failed_images} failed")
     
-    return {
+    return content, {
         "images_processed": processed_images,
         "images_failed": failed_images,
         "total_images": len(image_matches),
@@ -22,8 +22,6 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 from xml.etree import ElementTree as ET
 
-import pypandoc
-
 from docx2md.utils.docx_xml_utils import (
     NAMESPACES,
     create_text_run,
@@ -32,6 +30,7 @@ from docx2md.utils.docx_xml_utils import (
     unzip_docx,
 )
 from docx2md.utils.logging_utils import get_logger
+from docx2md.utils.pandoc_utils import convert_docx_to_markdown_text
 
 logger = get_logger(__name__)
 
@@ -85,7 +84,7 @@ class MathExtractor:
             )
 
             # Phase 2a: pandoc on math-free docx (structure + text)
-            markdown = self._run_pandoc(sanitized_docx, media_dir, extra_args)
+            markdown = self._run_pandoc(sanitized_docx, media_dir, extra_args, tmp)
 
             # Phase 2b: batch-convert equations to LaTeX
             if equations:
@@ -210,15 +209,14 @@ class MathExtractor:
     # ------------------------------------------------------------------
 
     def _run_pandoc(
-        self, docx_path: Path, media_dir: Path, extra_args: List[str]
+        self,
+        docx_path: Path,
+        media_dir: Path,
+        extra_args: List[str],
+        tmp_dir: Optional[Path] = None,
     ) -> str:
         """Run pandoc on the math-free docx to get structural markdown."""
-        return pypandoc.convert_file(
-            str(docx_path),
-            "markdown",
-            format="docx",
-            extra_args=extra_args,
-        )
+        return convert_docx_to_markdown_text(docx_path, extra_args, tmp_dir=tmp_dir)
 
     # ------------------------------------------------------------------
     # Phase 2b: batch equation conversion
@@ -285,11 +283,8 @@ class MathExtractor:
         rezip_docx(batch_dir, batch_docx)
 
         # Convert with pandoc
-        raw_md = pypandoc.convert_file(
-            str(batch_docx),
-            "markdown",
-            format="docx",
-            extra_args=["--wrap=none"],
+        raw_md = convert_docx_to_markdown_text(
+            batch_docx, ["--wrap=none"], tmp_dir=tmp_dir
         )
 
         # Parse output: markers like @@EQ_0042@@ followed by equation LaTeX
@@ -320,6 +315,9 @@ class MathExtractor:
         parts.append("</w:body></w:document>")
         return "\n".join(parts)
 
+    # Marker line preceding each equation in the batch document
+    _RE_MARKER = re.compile(r"@@EQ_(\d{4})@@")
+
     def _parse_batch_output(
         self, raw_md: str, equations: List[Dict[str, Any]]
     ) -> Dict[int, str]:
@@ -329,7 +327,7 @@ class MathExtractor:
         """
         result: Dict[int, str] = {}
         lines = raw_md.split("\n")
-        marker_re = re.compile(r"@@EQ_(\d{4})@@")
+        marker_re = self._RE_MARKER
 
         i = 0
         while i < len(lines):
@@ -384,6 +382,12 @@ class MathExtractor:
     # Regex to extract \tag{...} from equation content
     _RE_TAG = re.compile(r'\s*\\tag\{([^}]+)\}')
 
+    # $$ not followed by a newline: two adjacent inline equations
+    _RE_ADJACENT_INLINE = re.compile(r'\$\$(?!\n)')
+
+    # Blank-line runs left behind by display splicing
+    _RE_EXCESS_BLANKS = re.compile(r"\n{4,}")
+
     def _splice(
         self,
         markdown: str,
@@ -444,10 +448,10 @@ class MathExtractor:
             markdown = markdown.replace(placeholder, replacement)
 
         # Fix adjacent inline math: $...$$ → $...$ $ (add space)
-        markdown = re.sub(r'\$\$(?!\n)', _fix_adjacent_inline, markdown)
+        markdown = self._RE_ADJACENT_INLINE.sub(_fix_adjacent_inline, markdown)
 
         # Collapse excessive blank lines introduced by display splicing
-        markdown = re.sub(r"\n{4,}", "\n\n\n", markdown)
+        markdown = self._RE_EXCESS_BLANKS.sub("\n\n\n", markdown)
 
         return markdown
 
@@ -479,9 +483,7 @@ class MathExtractor:
         if longest > MathExtractor._WIDE_EQ_THRESHOLD:
             return True
         # Multiple matrices on one line (e.g. matrix product chains)
-        matrix_count = len(re.findall(
-            r"\\begin\{[pbBvV]?matrix\}", latex
-        ))
+        matrix_count = len(MathExtractor._RE_MATRIX_BEGIN.findall(latex))
         if matrix_count >= 3:
             return True
         return False
@@ -503,6 +505,9 @@ class MathExtractor:
     # Threshold (chars) above which a display equation gets \resizebox wrapping
     _WIDE_EQ_THRESHOLD = 300
 
+    # Start of a matrix environment (pmatrix, bmatrix, ...)
+    _RE_MATRIX_BEGIN = re.compile(r"\\begin\{[pbBvV]?matrix\}")
+
     # Matches bare \right without a valid delimiter.
     # Catches \right at end-of-line AND \right before \tag{...}
     _RE_BARE_RIGHT = re.compile(
@@ -131,6 +131,31 @@ def process_tables(
     if content is None:
         raise ValueError(f"Failed to read input file: {input_file}")
     
+    processed_content, stats = process_tables_str(content, table_format, header_style)
+    
+    # Write the output file
+    if not write_file(output_file, processed_content):
+        raise ValueError(f"Failed to write output file: {output_file}")
+    
+    return stats
+
+
+def process_tables_str(
+    content: str,
+    table_format: str = "pipe",
+    header_style: str = "bold",
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Process tables in Markdown content.
+    
+    Args:
+        content: Markdown content
+        table_format: Table format ('pipe', 'grid', or 'simple')
+        header_style: Header style ('bold', 'none')
+        
+    Returns:
+        Tuple of (processed content, dictionary with statistics about the processing)
+    """
     # Count tables before processing
     table_count = 0
     
@@ -149,13 +174,9 @@ def process_tables(
         # Simple format (no processing)
         processed_content = content
     
-    # Write the output file
-    if not write_file(output_file, processed_content):
-        raise ValueError(f"Failed to write output file: {output_file}")
-    
     logger.info(f"Processed {table_count} tables")
     
-    return {
+    return processed_content, {
         "tables_processed": table_count,
         "table_format": table_format,
     }
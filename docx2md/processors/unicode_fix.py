@@ -9,7 +9,7 @@ math delimiters ($...$ and $$...$$).
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
-from docx2md.processors.base import BaseProcessor
+from docx2md.processors.base import BaseProcessor, PipelineContext
 from docx2md.utils.logging_utils import get_logger
 from docx2md.utils.math_utils import tokenize_math_spans, reassemble
 
@@ -39,6 +39,13 @@ _IN_TEXT: List[Tuple[str, str]] = [
     ('θ',  '$\\theta$'),  # U+03B8 GREEK SMALL THETA → inline math in text
 ]
 
+# The tables above map single characters, and no replacement contains a
+# character that a later entry would rewrite, so each table can be applied
+# in one str.translate pass instead of one str.replace pass per entry.
+_ALWAYS_TABLE = str.maketrans(dict(_ALWAYS))
+_IN_MATH_TABLE = str.maketrans(dict(_IN_MATH))
+_IN_TEXT_TABLE = str.maketrans(dict(_IN_TEXT))
+
 # Combined ell+subscript digit sequence in text: ℓ₁ → $\ell_1$
 _ELL_SUB_TEXT = re.compile(r'ℓ([₀₁₂₃₄₅₆₇₈₉]+)')
 _SUB_DIGIT_MAP = str.maketrans('₀₁₂₃₄₅₆₇₈₉', '0123456789')
@@ -66,14 +73,29 @@ class UnicodeFixProcessor(BaseProcessor):
         cfg = (config or {}).get('unicode_fix', {})
         self.enabled = cfg.get('enabled', True)
         self.custom = cfg.get('custom_replacements', [])
+        # Built-in replacements only add $ (never remove one or empty a span),
+        # so the output tokens are reusable unless the $ count changed.
+        # Custom math/text rules must follow the same rules for that to hold.
+        self._custom_keeps_dollars = all(
+            '$' not in rule.get('char', '')
+            and all(rule[key] and '$' not in rule[key]
+                    for key in ('math', 'text') if key in rule)
+            for rule in self.custom
+        )
+
+    @classmethod
+    def is_noop(cls, config: Optional[Dict[str, Any]] = None) -> bool:
+        return not (config or {}).get('unicode_fix', {}).get('enabled', True)
 
     def process(self, content: str) -> str:
+        return self.process_context(PipelineContext(content)).content
+
+    def process_context(self, ctx: PipelineContext) -> PipelineContext:
         if not self.enabled:
-            return content
+            return ctx
 
         # Step 1: context-free replacements (safe anywhere)
-        for old, new in _ALWAYS:
-            content = content.replace(old, new)
+        content = ctx.content.translate(_ALWAYS_TABLE)
 
         # Apply custom always-replacements from config
         for rule in self.custom:
@@ -81,21 +103,29 @@ class UnicodeFixProcessor(BaseProcessor):
                 content = content.replace(rule['char'], rule['always'])
 
         # Step 2: tokenize and apply context-aware replacements
-        tokens = tokenize_math_spans(content)
+        if content == ctx.content:
+            tokens = ctx.math_tokens()
+        else:
+            tokens = tokenize_math_spans(content)
         result = []
         for kind, text in tokens:
             if kind == 'math':
                 text = _fix_in_math(text, self.custom)
             else:
                 text = _fix_in_text(text, self.custom)
-            result.append(text)
+            result.append((kind, text))
 
-        return ''.join(result)
+        ctx.content = reassemble(result)
+        # Text fixes like θ → $\theta$ add math spans: retokenize next time
+        if self._custom_keeps_dollars and ctx.content.count('$') == content.count('$'):
+            ctx.tokens = result
+        else:
+            ctx.tokens = None
+        return ctx
 
 
 def _fix_in_math(text: str, custom: list) -> str:
-    for old, new in _IN_MATH:
-        text = text.replace(old, new)
+    text = text.translate(_IN_MATH_TABLE)
     for rule in custom:
         if 'char' in rule and 'math' in rule:
             text = text.replace(rule['char'], rule['math'])
@@ -120,8 +150,7 @@ def _fix_in_text(text: str, custom: list) -> str:
 
     text = _SUB_DIGIT_TEXT.sub(_sub_digit, text)
 
-    for old, new in _IN_TEXT:
-        text = text.replace(old, new)
+    text = text.translate(_IN_TEXT_TABLE)
     for rule in custom:
         if 'char' in rule and 'text' in rule:
             text = text.replace(rule['char'], rule['text'])
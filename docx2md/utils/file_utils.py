@@ -43,6 +43,14 @@ def get_relative_path(file_path: Union[str, Path], base_path: Union[str, Path])
     return Path(file_path).relative_to(Path(base_path))
 
 
+def _path_suffix(name: str) -> str:
+    """Return the suffix of a file name, by the same rule as PurePath.suffix."""
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ""
+
+
 def find_files(
     directory: Union[str, Path],
     extensions: Optional[List[str]] = None,
@@ -51,6 +59,11 @@ def find_files(
     """
     Find files with specific extensions in a directory.
     
+    Extensions are compared case-insensitively.  A recursive search descends
+    into every subdirectory (hidden ones included) except symlinked ones,
+    like os.walk; it is implemented with os.scandir, whose entries carry
+    cached file types, so no extra stat call is made per path.
+    
     Args:
         directory: Directory to search in
         extensions: List of file extensions to include (e.g., ['.docx', '.doc'])
@@ -67,7 +80,7 @@ def find_files(
     
     # Normalize extensions to lowercase with leading dot
     if extensions:
-        normalized_extensions = {
+        normalized_extensions: Optional[Set[str]] = {
             ext.lower() if ext.startswith(".") else f".{ext.lower()}"
             for ext in extensions
         }
@@ -75,17 +88,34 @@ def find_files(
         normalized_extensions = None
     
     result = []
+    stack = [directory_path]
     
-    if recursive:
-        for root, _, files in os.walk(directory_path):
-            for file in files:
-                file_path = Path(root) / file
-                if normalized_extensions is None or file_path.suffix.lower() in normalized_extensions:
-                    result.append(file_path)
-    else:
-        for file_path in directory_path.iterdir():
-            if file_path.is_file() and (normalized_extensions is None or file_path.suffix.lower() in normalized_extensions):
-                result.append(file_path)
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            # Like os.walk, skip directories that cannot be read
+            if current is directory_path and not recursive:
+                raise
+            continue
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if recursive and not entry.is_symlink():
+                    stack.append(current / entry.name)
+                continue
+            # os.walk lists every non-directory entry; without recursion only
+            # regular files (or links to them) are returned
+            if not recursive and not entry.is_file():
+                continue
+            if (normalized_extensions is None
+                    or _path_suffix(entry.name).lower() in normalized_extensions):
+                result.append(current / entry.name)
     
     return sorted(result)
 
@@ -0,0 +1,51 @@
+"""
+Pandoc helpers for docx2md.
+
+Wraps pypandoc so that every docx → markdown conversion goes through one
+code path.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Union
+
+
+def convert_docx_to_markdown_text(
+    docx_path: Union[str, Path],
+    extra_args: List[str],
+    tmp_dir: Optional[Union[str, Path]] = None,
+) -> str:
+    """Convert a .docx file to pandoc markdown and return the text.
+
+    pandoc writes its output to a temporary file which is then read once.
+    Capturing pandoc's stdout instead keeps the raw bytes and the decoded
+    string alive together, roughly doubling peak memory on large books.
+
+    Args:
+        docx_path: Path to the .docx file.
+        extra_args: Extra arguments to pass to pandoc.
+        tmp_dir: Directory for the temporary output file (optional).
+
+    Returns:
+        The markdown produced by pandoc.
+    """
+    import pypandoc
+
+    fd, out_path = tempfile.mkstemp(suffix=".md", dir=tmp_dir)
+    os.close(fd)
+    try:
+        pypandoc.convert_file(
+            os.fspath(docx_path),
+            "markdown",
+            format="docx",
+            extra_args=extra_args,
+            outputfile=out_path,
+        )
+        with open(out_path, "r", encoding="utf-8") as f:
+            return f.read()
+    finally:
+        try:
+            os.unlink(out_path)
+        except OSError:
+            pass
@@ -0,0 +1,79 @@
+"""
+Tests for the base processor module.
+"""
+
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from docx2md.processors.images import ImageProcessor
+
+
+class TestProcessStream(unittest.TestCase):
+    """Test cases for streamed processing of line-oriented processors."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.test_dir = Path(self.temp_dir.name)
+        image = self.test_dir / "figure.png"
+        image.write_bytes(b"png bytes")
+        self.processor = ImageProcessor({"images": {
+            "extract_path": str(self.test_dir / "img"),
+            "optimize": False,
+        }})
+        self.content = "".join(
+            f"Paragraph {i} with ![Figure {i}]({image}) and "
+            f"![missing](nowhere/{i}.png).\n\n"
+            for i in range(50)
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_stream_matches_process(self):
+        expected = self.processor.process(self.content)
+        self.assertIn(str(self.test_dir / "img" / "figure.png"), expected)
+
+        writer = io.StringIO()
+        with patch("docx2md.processors.base._STREAM_CHUNK", 64), \
+                patch.object(ImageProcessor, "process",
+                             wraps=self.processor.process) as process:
+            self.processor.process_stream(io.StringIO(self.content), writer)
+        self.assertGreater(process.call_count, 1)
+        self.assertEqual(writer.getvalue(), expected)
+
+    def test_process_file_streams_to_output(self):
+        input_file = self.test_dir / "input.md"
+        output_file = self.test_dir / "output.md"
+        input_file.write_text(self.content, encoding="utf-8")
+
+        with patch("docx2md.processors.base._STREAM_CHUNK", 64):
+            result = self.processor.process_file(input_file, output_file)
+        self.assertTrue(result["success"])
+        self.assertEqual(
+            output_file.read_text(encoding="utf-8"),
+            self.processor.process(self.content),
+        )
+
+    def test_failed_stream_keeps_previous_output(self):
+        input_file = self.test_dir / "input.md"
+        output_file = self.test_dir / "output.md"
+        input_file.write_text(self.content, encoding="utf-8")
+        output_file.write_text("previous output\n", encoding="utf-8")
+
+        with patch("docx2md.processors.base._STREAM_CHUNK", 64), \
+                patch.object(ImageProcessor, "process",
+                             side_effect=["chunk\n", RuntimeError("boom")]):
+            result = self.processor.process_file(input_file, output_file)
+        self.assertFalse(result["success"])
+        self.assertEqual(output_file.read_text(encoding="utf-8"), "previous output\n")
+        self.assertEqual(
+            sorted(p.name for p in self.test_dir.iterdir()),
+            ["figure.png", "input.md", "output.md"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 Tests for the WordCleanupProcessor module.
 """
 
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -114,6 +115,12 @@ class TestWordCleanupProcessor(unittest.TestCase):
         self.assertNotIn('/tmp/output/img/image.png', result)
         self.assertIn('img/image.png', result)
 
+    def test_repeated_image_path(self):
+        output_dir = Path('/tmp/output')
+        content = "![a](/tmp/output/logo.png) ![b](/tmp/output/logo.png) ![c](logo.png)"
+        result = self._proc(output_dir=output_dir).process(content)
+        self.assertEqual(result, "![a](logo.png) ![b](logo.png) ![c](logo.png)")
+
     def test_relative_path_unchanged(self):
         content = "![fig](img/image.png)"
         result = self._proc().process(content)
@@ -135,6 +142,22 @@ class TestWordCleanupProcessor(unittest.TestCase):
         result = self._proc(config).process(content)
         self.assertIn("***Bold Title***", result)
 
+    # ------------------------------------------------------------------
+    # Batch processing
+    # ------------------------------------------------------------------
+
+    def test_process_files_in_processes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pairs = []
+            for i in range(2):
+                path = Path(tmp) / f"in{i}.md"
+                path.write_text(f"# ***Title {i}***\n\n$$$x$$\n", encoding="utf-8")
+                pairs.append((path, Path(tmp) / f"out{i}.md"))
+            results = self._proc().process_files(pairs, max_workers=2, use_processes=True)
+            self.assertEqual([r["success"] for r in results], [True] * 2)
+            for i, (_, out) in enumerate(pairs):
+                self.assertEqual(out.read_text(encoding="utf-8"), f"# Title {i}\n\n$$x$$\n")
+
 
 if __name__ == "__main__":
     unittest.main()
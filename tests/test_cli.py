@@ -81,6 +81,20 @@ class TestCLI(unittest.TestCase):
         mock_convert.assert_called_once()
         args, kwargs = mock_convert.call_args
         self.assertEqual(str(args[0]), str(input_file))
+        self.assertNotIn("skip_unchanged", args[2].get("processing", {}))
+    
+    @patch("docx2md.converter.convert_docx_to_markdown")
+    def test_convert_command_skip_unchanged(self, mock_convert):
+        """Test that --skip-unchanged turns on processing.skip_unchanged."""
+        input_file = self.test_dir / "test.docx"
+        input_file.write_text("Dummy DOCX content")
+        mock_convert.return_value = {}
+        
+        result = self.runner.invoke(main, ["convert", "--skip-unchanged", str(input_file)])
+        
+        self.assertEqual(result.exit_code, 0)
+        args, kwargs = mock_convert.call_args
+        self.assertTrue(args[2]["processing"]["skip_unchanged"])
     
     @patch("docx2md.converter.batch_convert")
     def test_batch_command(self, mock_batch):
@@ -0,0 +1,99 @@
+"""
+Tests for the config module.
+"""
+
+import os
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+from docx2md.config import (
+    DEFAULT_CONFIG,
+    _copy_config,
+    _parse_env_value,
+    _validate_config,
+    load_config,
+)
+
+
+class TestLoadConfig(unittest.TestCase):
+    """Test cases for load_config."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.test_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, name, text):
+        path = self.test_dir / name
+        path.write_text(text)
+        return path
+
+    def test_defaults(self):
+        config = load_config()
+        self.assertEqual(config["tables"]["format"], "pipe")
+        self.assertTrue(config["processing"]["cleanup"])
+
+    def test_defaults_are_valid(self):
+        # load_config() skips validation for the plain defaults
+        config = _copy_config(DEFAULT_CONFIG)
+        _validate_config(config)
+        self.assertEqual(config, DEFAULT_CONFIG)
+        self.assertEqual(load_config(), DEFAULT_CONFIG)
+
+    def test_file_overrides_nested_value(self):
+        path = self._write("config.yaml", "tables:\n  format: grid\n")
+        config = load_config(path)
+        self.assertEqual(config["tables"]["format"], "grid")
+        self.assertEqual(config["tables"]["header_style"], "bold")
+
+    def test_merge_does_not_mutate_defaults(self):
+        path = self._write("config.yaml", "tables:\n  format: grid\n")
+        load_config(path)
+        self.assertEqual(DEFAULT_CONFIG["tables"]["format"], "pipe")
+        self.assertEqual(load_config()["tables"]["format"], "pipe")
+
+    def test_returned_config_is_private(self):
+        path = self._write("config.yaml", "cleanup:\n  remove_toc: false\n")
+        first = load_config(path)
+        first["cleanup"]["remove_toc"] = True
+        first["equations"]["inline_delimiters"].append("x")
+        second = load_config(path)
+        self.assertFalse(second["cleanup"]["remove_toc"])
+        self.assertEqual(second["equations"]["inline_delimiters"], ["$", "$"])
+
+    def test_modified_file_is_reparsed(self):
+        path = self._write("config.yaml", "tables:\n  format: grid\n")
+        self.assertEqual(load_config(path)["tables"]["format"], "grid")
+        path.write_text("tables:\n  format: simple\n")
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        self.assertEqual(load_config(path)["tables"]["format"], "simple")
+
+    def test_env_override_follows_environment(self):
+        with unittest.mock.patch.dict(os.environ, {"DOCX2MD_TABLES__FORMAT": "grid"}):
+            self.assertEqual(load_config()["tables"]["format"], "grid")
+        with unittest.mock.patch.dict(os.environ, {"DOCX2MD_TABLES__FORMAT": "simple"}):
+            self.assertEqual(load_config()["tables"]["format"], "simple")
+        self.assertEqual(load_config()["tables"]["format"], "pipe")
+
+    def test_non_dict_file_ignored(self):
+        path = self._write("config.yaml", "- just\n- a list\n")
+        config = load_config(path)
+        self.assertEqual(config["tables"]["format"], "pipe")
+
+    def test_parse_env_value(self):
+        self.assertIs(_parse_env_value("Yes"), True)
+        self.assertIs(_parse_env_value("0"), False)
+        self.assertEqual(_parse_env_value("-12"), -12)
+        self.assertEqual(_parse_env_value("2.5"), 2.5)
+        self.assertEqual(_parse_env_value("1e3"), 1000.0)
+        self.assertEqual(_parse_env_value("a, b"), ["a", "b"])
+        self.assertEqual(_parse_env_value("grid"), "grid")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ import unittest
 from pathlib import Path
 
 import pytest
+from unittest.mock import patch
 
 from docx2md.converter import convert_docx_to_markdown, batch_convert
 
@@ -46,6 +47,91 @@ class TestConverter(unittest.TestCase):
         with pytest.raises(ValueError):
             convert_docx_to_markdown(input_file, output_file)
     
+    def test_unchanged_input_is_skipped(self):
+        """A second conversion of an unchanged document reuses the output."""
+        input_file = self.test_dir / "doc.docx"
+        input_file.write_bytes(b"docx bytes")
+        output_file = self.test_dir / "out" / "doc.md"
+        config = {"processing": {
+            "math_extraction": False,
+            "extract_images": False,
+            "generate_frontmatter": False,
+        }}
+        cache_file = output_file.with_name("doc.md.cache")
+        
+        with patch("docx2md.processors.docx.extract_docx_content",
+                   return_value={"properties": {}}), \
+             patch("docx2md.converter.convert_docx_to_markdown_text",
+                   return_value="# Title\n\nText\n") as pandoc:
+            # Off by default: always reconverts and writes no sidecar
+            convert_docx_to_markdown(input_file, output_file, config)
+            convert_docx_to_markdown(input_file, output_file, config)
+            self.assertEqual(pandoc.call_count, 2)
+            self.assertFalse(cache_file.exists())
+            pandoc.reset_mock()
+            
+            config["processing"]["skip_unchanged"] = True
+            first = convert_docx_to_markdown(input_file, output_file, config)
+            second = convert_docx_to_markdown(input_file, output_file, config)
+            self.assertEqual(pandoc.call_count, 1)
+            self.assertTrue(second["cached"])
+            self.assertEqual(second["tables_count"], first["tables_count"])
+            
+            input_file.write_bytes(b"changed docx bytes")
+            third = convert_docx_to_markdown(input_file, output_file, config)
+            self.assertEqual(pandoc.call_count, 2)
+            self.assertNotIn("cached", third)
+    
+    def test_skip_checks_output_is_current(self):
+        """A sidecar is only trusted while the output it describes is untouched."""
+        a_file = self.test_dir / "a.docx"
+        b_file = self.test_dir / "b.docx"
+        a_file.write_bytes(b"a docx bytes")
+        b_file.write_bytes(b"b docx bytes")
+        output_file = self.test_dir / "out.md"
+        cache_file = self.test_dir / "out.md.cache"
+        config = {"processing": {
+            "math_extraction": False,
+            "extract_images": False,
+            "generate_frontmatter": False,
+            "skip_unchanged": True,
+        }}
+        uncached = {"processing": {**config["processing"], "skip_unchanged": False}}
+        
+        image_file = self.test_dir / "img" / "media" / "image1.png"
+        
+        def pandoc_text(input_path, *args, **kwargs):
+            image_file.parent.mkdir(parents=True, exist_ok=True)
+            image_file.write_bytes(b"png bytes")
+            name = Path(input_path).stem
+            return f"# {name}\n\n![Figure](img/media/image1.png)\n"
+        
+        with patch("docx2md.processors.docx.extract_docx_content",
+                   return_value={"properties": {}}), \
+             patch("docx2md.converter.convert_docx_to_markdown_text",
+                   side_effect=pandoc_text):
+            # a -> out.md cached, b -> out.md uncached, a again must reconvert
+            convert_docx_to_markdown(a_file, output_file, config)
+            self.assertIn("image1.png", cache_file.read_text(encoding="utf-8"))
+            convert_docx_to_markdown(b_file, output_file, uncached)
+            self.assertFalse(cache_file.exists())
+            result = convert_docx_to_markdown(a_file, output_file, config)
+            self.assertNotIn("cached", result)
+            self.assertTrue(output_file.read_text(encoding="utf-8").startswith("# a\n"))
+            
+            # A hand edit to the output invalidates the sidecar
+            output_file.write_text("# edited by hand\n", encoding="utf-8")
+            result = convert_docx_to_markdown(a_file, output_file, config)
+            self.assertNotIn("cached", result)
+            self.assertTrue(output_file.read_text(encoding="utf-8").startswith("# a\n"))
+            
+            # So does deleting an extracted image it references
+            result = convert_docx_to_markdown(a_file, output_file, config)
+            self.assertTrue(result["cached"])
+            image_file.unlink()
+            result = convert_docx_to_markdown(a_file, output_file, config)
+            self.assertNotIn("cached", result)
+    
     @pytest.mark.skip(reason="Requires actual DOCX file")
     def test_convert_docx_to_markdown_basic(self):
         """Test basic conversion with a simple DOCX file."""
@@ -3,8 +3,12 @@ Tests for the EquationFixProcessor module.
 """
 
 import unittest
+import unittest.mock
 
+from docx2md.processors.base import PipelineContext
 from docx2md.processors.equation_fix import EquationFixProcessor
+from docx2md.processors.unicode_fix import UnicodeFixProcessor
+from docx2md.utils.math_utils import tokenize_math_spans
 
 
 class TestEquationFixProcessor(unittest.TestCase):
@@ -98,6 +102,26 @@ class TestEquationFixProcessor(unittest.TestCase):
         result = self._proc(config).process(content)
         self.assertEqual(result, content)
 
+    # ------------------------------------------------------------------
+    # Pipeline context
+    # ------------------------------------------------------------------
+
+    def test_context_tokens_reused(self):
+        content = "Let $\\hslash$ and $$\\sum_{}^{}i = 1^{n}$$ with Β."
+        with unittest.mock.patch(
+            "docx2md.processors.base.tokenize_math_spans", wraps=tokenize_math_spans
+        ) as tokenize:
+            ctx = UnicodeFixProcessor().process_context(PipelineContext(content))
+            ctx = self._proc().process_context(ctx)
+        self.assertEqual(tokenize.call_count, 1)
+        self.assertEqual(ctx.content, self._proc().process(UnicodeFixProcessor().process(content)))
+        self.assertEqual(ctx.tokens, tokenize_math_spans(ctx.content))
+
+    def test_context_tokens_dropped_when_math_added(self):
+        ctx = UnicodeFixProcessor().process_context(PipelineContext("angle θ"))
+        self.assertEqual(ctx.content, "angle $\\theta$")
+        self.assertIsNone(ctx.tokens)
+
 
 if __name__ == "__main__":
     unittest.main()
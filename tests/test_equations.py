@@ -9,7 +9,12 @@ from pathlib import Path
 
 import pytest
 
-from docx2md.processors.equations import fix_delimiters, validate_equations
+from docx2md.processors.equations import (
+    _is_valid_equation,
+    fix_delimiters,
+    fix_delimiters_str,
+    validate_equations,
+)
 
 
 class TestEquations(unittest.TestCase):
@@ -102,6 +107,39 @@ F = ma
         self.assertIn("This is an inline equation: \\(E = mc^2\\)", content)
         self.assertIn("\\begin{equation}\nF = ma\n\\end{equation}", content)
     
+    def test_fix_delimiters_str(self):
+        """Test fixing equation delimiters in memory."""
+        content, result = fix_delimiters_str("Inline \\(x\\) and \\[y\\]")
+        
+        self.assertEqual(content, "Inline $x$ and $$y$$")
+        self.assertEqual(result["inline_original"], 1)
+        self.assertEqual(result["display_original"], 1)
+    
+    def test_fix_delimiters_str_nested_and_unpaired(self):
+        """Test that nested and unpaired delimiters are left to the regex."""
+        content, result = fix_delimiters_str("\\(a \\[b\\] c\\) and \\(d")
+        
+        self.assertEqual(content, "$a $$b$$ c$ and \\(d")
+        self.assertEqual(result["inline_original"], 1)
+        self.assertEqual(result["display_original"], 1)
+    
+    def test_fix_delimiters_str_crossed_pairs(self):
+        """Test that crossed pairs are swept inline first, then display."""
+        content, result = fix_delimiters_str("\\(a \\[b\\) c\\]")
+        self.assertEqual(content, "$a $$b$ c$$")
+        self.assertEqual(result["inline_original"], 1)
+        self.assertEqual(result["display_original"], 1)
+        
+        content, _ = fix_delimiters_str("\\[a \\(b\\] c\\)")
+        self.assertEqual(content, "$$a $b$$ c$")
+        
+        content, _ = fix_delimiters_str(
+            "\\(a \\[b\\) c\\]",
+            inline_delimiters=("<i>", "</i>"),
+            display_delimiters=("\\begin{equation}", "\\end{equation}"),
+        )
+        self.assertEqual(content, "<i>a \\begin{equation}b</i> c\\end{equation}")
+    
     def test_validate_equations_valid(self):
         """Test validating equations with valid equations."""
         # Create a test file with valid equations
@@ -169,6 +207,16 @@ $$
         self.assertEqual(result["display_count"], 1)
         self.assertGreater(result["invalid_count"], 0)
         self.assertGreater(len(result["issues"]), 0)
+    
+    def test_is_valid_equation_environments(self):
+        """Test environment checks, including nesting in strict mode."""
+        nested = "\\begin{equation}\\begin{aligned}x\\end{aligned}\\end{equation}"
+        crossed = "\\begin{equation}\\begin{aligned}x\\end{equation}\\end{aligned}"
+        
+        self.assertTrue(_is_valid_equation(nested, strict=True))
+        self.assertTrue(_is_valid_equation(crossed))
+        self.assertFalse(_is_valid_equation(crossed, strict=True))
+        self.assertFalse(_is_valid_equation("\\begin{aligned}x"))
 
 
 if __name__ == "__main__":
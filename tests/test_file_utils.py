@@ -0,0 +1,57 @@
+"""
+Tests for the file utilities module.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from docx2md.utils.file_utils import find_files
+
+
+class TestFindFiles(unittest.TestCase):
+    """Test cases for find_files."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.test_dir = Path(self.temp_dir.name)
+        for rel in (
+            "a.docx",
+            "B.DOCX",
+            "notes.txt",
+            ".hidden/c.docx",
+            "sub/d.Docx",
+            "sub/.git/e.docx",
+        ):
+            path = self.test_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _names(self, paths):
+        return [p.relative_to(self.test_dir).as_posix() for p in paths]
+
+    def test_extensions_match_case_insensitively(self):
+        found = find_files(self.test_dir, [".docx"])
+        self.assertEqual(self._names(found), ["B.DOCX", "a.docx"])
+        self.assertEqual(find_files(self.test_dir, ["DOCX"]), found)
+
+    def test_recursive_includes_hidden_directories(self):
+        found = find_files(self.test_dir, [".docx"], recursive=True)
+        self.assertEqual(
+            self._names(found),
+            [".hidden/c.docx", "B.DOCX", "a.docx", "sub/.git/e.docx", "sub/d.Docx"],
+        )
+
+    def test_no_extensions_lists_all_files(self):
+        found = find_files(self.test_dir)
+        self.assertEqual(self._names(found), ["B.DOCX", "a.docx", "notes.txt"])
+
+    def test_missing_directory(self):
+        self.assertEqual(find_files(self.test_dir / "missing"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
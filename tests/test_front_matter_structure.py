@@ -139,6 +139,23 @@ class TestPassthrough(unittest.TestCase):
         self.assertEqual(content, result)
 
 
+class TestBodyTitleFragments(unittest.TestCase):
+
+    def _strip(self, content):
+        return FrontMatterStructureProcessor({})._strip_body_title_fragments(content, 'My Book')
+
+    def test_volume_anchor_and_subtitle_stripped(self):
+        content = (
+            '# Part\n\nVolume I, Part 1:\n\nMathematical Foundations\n\n'
+            '# Chapter 1\n\nBody.'
+        )
+        self.assertEqual(self._strip(content), '# Part\n\n# Chapter 1\n\nBody.')
+
+    def test_no_anchor_unchanged(self):
+        content = '# Part\nThe volume of the box.\n# Chapter 1\nBody.'
+        self.assertEqual(self._strip(content), content)
+
+
 class TestCombinedScenario(unittest.TestCase):
 
     def test_full_front_matter_pipeline(self):
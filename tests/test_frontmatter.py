@@ -195,6 +195,17 @@ class TestGenerateYamlFrontmatter(unittest.TestCase):
         self.assertNotIn("**My Title**", updated)
         self.assertIn("Body paragraph.", updated)
 
+    def test_title_block_with_author_stripped(self):
+        content = (
+            "**My Title**\n\n*Sub*\n\n"
+            "Jean-Paul Doe   --  <jp@example.com>\n\n"
+            "Body paragraph."
+        )
+        fm_str, updated = self._gen(content=content)
+        fm = _parse_yaml(fm_str)
+        self.assertEqual(fm["author"], "Jean-Paul Doe")
+        self.assertEqual(updated, "Body paragraph.")
+
     # ------------------------------------------------------------------
     # Disabled generator
     # ------------------------------------------------------------------
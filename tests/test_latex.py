@@ -0,0 +1,44 @@
+"""
+Tests for the LaTeX formatter module.
+"""
+
+import unittest
+
+from docx2md.formatters.latex import (
+    escape_latex,
+    format_aligned_equations,
+    format_cases,
+)
+
+
+class TestLatexFormatter(unittest.TestCase):
+    """Test cases for the LaTeX formatter."""
+
+    def test_escape_latex(self):
+        self.assertEqual(escape_latex("plain text"), "plain text")
+        self.assertEqual(
+            escape_latex("50% of a_1 & \\x"),
+            "50\\% of a\\_1 \\& \\textbackslash{}x",
+        )
+        self.assertEqual(escape_latex("~"), "\\textasciitilde{}")
+
+    def test_format_cases(self):
+        result = format_cases([("x", "x > 0"), ("0", "")])
+        self.assertEqual(
+            result,
+            "\\begin{cases}\n"
+            "x & \\text{x > 0} \\\\\n"
+            "0 & \\\\\n"
+            "\\end{cases}",
+        )
+
+    def test_format_aligned_equations(self):
+        result = format_aligned_equations(["a = b", "c & d \\\\"], numbered=True)
+        self.assertEqual(
+            result,
+            "\\begin{align}\na  &=  b \\\\\nc & d\n\\end{align}",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
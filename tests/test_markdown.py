@@ -0,0 +1,43 @@
+"""
+Tests for the Markdown formatter module.
+"""
+
+import unittest
+
+from docx2md.formatters.markdown import format_table
+
+
+class TestMarkdownFormatter(unittest.TestCase):
+    """Test cases for the Markdown formatter."""
+
+    def test_format_table(self):
+        result = format_table(
+            ["Name", "Value"],
+            [["a", "1"], ["b"], ["c", "3", "extra"]],
+            ["left", "right"],
+        )
+        self.assertEqual(
+            result,
+            "| Name | Value |\n"
+            "| :--- | ---: |\n"
+            "| a | 1 |\n"
+            "| b |  |\n"
+            "| c | 3 |",
+        )
+
+    def test_format_table_escapes_pipes(self):
+        result = format_table(["a|b", "Value"], [["x | y", "$a|b$"]])
+        self.assertEqual(
+            result,
+            "| a\\|b | Value |\n"
+            "| :--- | :--- |\n"
+            "| x \\| y | $a\\|b$ |",
+        )
+
+    def test_format_table_empty(self):
+        self.assertEqual(format_table([], [["a"]]), "")
+        self.assertEqual(format_table(["a"], []), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,9 @@
 Tests for the UnicodeFixProcessor module.
 """
 
+import tempfile
 import unittest
+from pathlib import Path
 
 from docx2md.processors.unicode_fix import UnicodeFixProcessor
 
@@ -113,6 +115,23 @@ class TestUnicodeFixProcessor(unittest.TestCase):
         result = self._proc(config).process(content)
         self.assertEqual(result, content)
 
+    def test_is_noop(self):
+        self.assertTrue(UnicodeFixProcessor.is_noop({"unicode_fix": {"enabled": False}}))
+        self.assertFalse(UnicodeFixProcessor.is_noop({"unicode_fix": {"enabled": True}}))
+        self.assertFalse(UnicodeFixProcessor.is_noop(None))
+
+    def test_process_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pairs = []
+            for i in range(3):
+                path = Path(tmp) / f"in{i}.md"
+                path.write_text(f"File\u00a0{i}", encoding="utf-8")
+                pairs.append((path, Path(tmp) / f"out{i}.md"))
+            results = self._proc().process_files(pairs, max_workers=2)
+            self.assertEqual([r["success"] for r in results], [True] * 3)
+            for i, (_, out) in enumerate(pairs):
+                self.assertEqual(out.read_text(encoding="utf-8"), f"File {i}")
+
 
 if __name__ == "__main__":
     unittest.main()